@@ -35,7 +35,7 @@ sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), ".."
 
 from src.database import Base  # noqa: E402
 from src.models import *  # noqa: F401, F403, E402
-from src.settings import settings  # noqa: E402
+from src.settings import get_settings  # noqa: E402
 
 # -------------------------------------------------------------------------- #
 #                         CONFIGURAÇÃO GERAL DO ALEMBIC                      #
@@ -46,7 +46,7 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URL))
+config.set_main_option("sqlalchemy.url", str(get_settings().DATABASE_URL))
 
 target_metadata = Base.metadata
 
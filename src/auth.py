@@ -16,7 +16,7 @@ from sqlalchemy.orm import Session
 
 from . import crud, models
 from .database import get_db
-from .settings import settings
+from .settings import get_settings
 
 # -------------------------------------------------------------------------- #
 #                         CONFIGURAÇÕES DE SEGURANÇA                         #
@@ -81,7 +81,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, get_settings().JWT_SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def create_password_reset_token() -> str:
@@ -120,7 +120,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, get_settings().JWT_SECRET_KEY, algorithms=[ALGORITHM])
         email = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -12,9 +12,9 @@ transações e encapsulando as regras de negócio de acesso a dados.
 # -------------------------------------------------------------------------- #
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 
-from sqlalchemy import or_
+from sqlalchemy import Row, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload, selectinload
 
@@ -27,7 +27,7 @@ from . import auth, models, schemas
 
 def get_banner(db: Session, banner_id: int) -> Optional[models.Banner]:
     """Busca um único banner pelo seu ID."""
-    return db.query(models.Banner).filter(models.Banner.id == banner_id).first()
+    return db.get(models.Banner, banner_id)
 
 
 def get_all_banners(
@@ -93,7 +93,7 @@ def delete_banner(db: Session, banner_id: int) -> Optional[models.Banner]:
 
 def get_category(db: Session, category_id: int) -> Optional[models.Category]:
     """Busca uma única categoria pelo seu ID."""
-    return db.query(models.Category).filter(models.Category.id == category_id).first()
+    return db.get(models.Category, category_id)
 
 
 def get_categories(
@@ -142,7 +142,7 @@ def delete_category(db: Session, category_id: int) -> Optional[models.Category]:
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[models.User]:
     """[Admin] Busca um único usuário pelo seu ID."""
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return db.get(models.User, user_id)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
@@ -173,9 +173,21 @@ def create_user(
 
 
 def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> list[models.User]:
-    """[Admin] Busca todos os usuários (clientes), com paginação."""
+    """
+    [Admin] Busca todos os usuários (clientes), com paginação.
+
+    Pré-carrega os pedidos de cada usuário e toda a árvore serializada por
+    `schemas.User` (itens, produtos, categorias e avaliações), evitando
+    consultas N+1 durante a serialização da resposta.
+    """
     return (
         db.query(models.User)
+        .options(
+            selectinload(models.User.orders)
+            .selectinload(models.Order.items)
+            .selectinload(models.OrderItem.product)
+            .options(*_product_read_options())
+        )
         .filter(models.User.is_superuser.is_(False))
         .offset(skip)
         .limit(limit)
@@ -272,6 +284,19 @@ def delete_user(db: Session, user_id: int) -> Optional[models.User]:
 # -------------------------------------------------------------------------- #
 
 
+def _product_read_options() -> tuple:
+    """
+    Opções de carregamento para os relacionamentos serializados por
+    `schemas.Product` (categoria e avaliações com seus autores).
+    """
+    return (
+        selectinload(models.Product.category),
+        selectinload(models.Product.reviews).selectinload(
+            models.ProductReview.author
+        ),
+    )
+
+
 def get_product(db: Session, product_id: int) -> Optional[models.Product]:
     """Busca um único produto pelo seu ID, pré-carregando avaliações."""
     return (
@@ -593,6 +618,9 @@ def remove_coupon_from_cart(db: Session, cart: models.Cart) -> models.Cart:
 #                         CRUD FUNCTIONS - ORDER                             #
 # -------------------------------------------------------------------------- #
 
+# Quantidade de pedidos carregados por lote na listagem em streaming.
+ORDER_STREAM_BATCH_SIZE = 500
+
 
 class OrderCreationError(Exception):
     """Exceção customizada para erros na criação do pedido."""
@@ -612,9 +640,7 @@ def create_order_from_cart(db: Session, user: models.User) -> models.Order:
     if not cart or not cart.items:
         raise OrderCreationError("Carrinho vazio. Não é possível criar um pedido.")
 
-    subtotal = sum(
-        item.product.price * item.quantity for item in cart.items if item.product
-    )
+    subtotal = cart.subtotal
 
     discount_amount = 0.0
     coupon_code_used = None
@@ -682,19 +708,61 @@ def create_order_from_cart(db: Session, user: models.User) -> models.Order:
         )
 
 
-def get_orders_by_user(db: Session, user_id: int) -> list[models.Order]:
-    """Busca todos os pedidos de um usuário."""
-    return (
-        db.query(models.Order)
-        .filter(models.Order.user_id == user_id)
+def iter_orders_by_user(db: Session, user_id: int) -> Iterator[models.Order]:
+    """
+    Percorre os pedidos de um usuário, do mais recente ao mais antigo.
+
+    Os pedidos são carregados em lotes (`yield_per`), junto com seus itens e
+    produtos, de modo que apenas um lote permanece em memória por vez.
+    """
+    stmt = (
+        select(models.Order)
+        .where(models.Order.user_id == user_id)
         .order_by(models.Order.created_at.desc())
-        .all()
+        .options(
+            selectinload(models.Order.items).selectinload(models.OrderItem.product)
+        )
+        .execution_options(yield_per=ORDER_STREAM_BATCH_SIZE)
     )
+    return iter(db.scalars(stmt))
 
 
 def get_order_by_id(db: Session, order_id: int) -> Optional[models.Order]:
     """Busca um pedido específico pelo seu ID."""
-    return db.query(models.Order).filter(models.Order.id == order_id).first()
+    return db.get(models.Order, order_id)
+
+
+def get_order_with_details(db: Session, order_id: int) -> Optional[models.Order]:
+    """Busca um pedido pelo ID, pré-carregando o cliente, os itens e os produtos."""
+    return (
+        db.query(models.Order)
+        .options(
+            joinedload(models.Order.customer),
+            joinedload(models.Order.items).joinedload(models.OrderItem.product),
+        )
+        .filter(models.Order.id == order_id)
+        .first()
+    )
+
+
+def get_order_line_items(db: Session, order_id: int) -> List[Row]:
+    """
+    Busca os itens de um pedido como tuplas (quantidade, nome, preço).
+
+    Projeta apenas as colunas necessárias em uma única consulta, sem
+    instanciar objetos `OrderItem`/`Product`. O nome é `None` quando o
+    produto foi removido do catálogo.
+    """
+    stmt = (
+        select(
+            models.OrderItem.quantity,
+            models.Product.name,
+            models.OrderItem.price_at_purchase,
+        )
+        .outerjoin(models.OrderItem.product)
+        .where(models.OrderItem.order_id == order_id)
+    )
+    return list(db.execute(stmt).all())
 
 
 def get_all_orders(db: Session, skip: int = 0, limit: int = 100) -> list[models.Order]:
@@ -703,7 +771,9 @@ def get_all_orders(db: Session, skip: int = 0, limit: int = 100) -> list[models.
         db.query(models.Order)
         .options(
             joinedload(models.Order.customer),
-            selectinload(models.Order.items).joinedload(models.OrderItem.product),
+            selectinload(models.Order.items)
+            .joinedload(models.OrderItem.product)
+            .options(*_product_read_options()),
         )
         .order_by(models.Order.created_at.desc())
         .offset(skip)
@@ -10,7 +10,7 @@ import logging
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-from .settings import settings
+from .settings import get_settings
 
 # -------------------------------------------------------------------------- #
 #                       CONFIGURAÇÃO INICIAL E LOGGING                       #
@@ -22,7 +22,7 @@ log = logging.getLogger(__name__)
 #                         CONFIGURAÇÃO DO BANCO DE DADOS                     #
 # -------------------------------------------------------------------------- #
 
-engine = create_engine(str(settings.DATABASE_URL))
+engine = create_engine(str(get_settings().DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -14,7 +14,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from .database import engine, Base  # noqa: F401
-from .settings import settings 
 
 # -------------------------------------------------------------------------- #
 #                        IMPORTS DOS MÓDULOS DE ROTAS                        #
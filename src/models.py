@@ -21,8 +21,9 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    select,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import func
 from typing import List, Optional
 
@@ -208,6 +209,19 @@ class CartItem(Base):
     product: Mapped["Product"] = relationship()
 
 
+# O subtotal do carrinho é calculado pelo banco (SUM de preço x quantidade)
+# como uma subconsulta correlacionada, carregada junto com o próprio `Cart`.
+# Definido após `CartItem` porque a expressão depende das duas tabelas.
+Cart.subtotal = column_property(
+    select(func.coalesce(func.sum(Product.price * CartItem.quantity), 0.0))
+    .select_from(CartItem)
+    .join(Product, CartItem.product_id == Product.id)
+    .where(CartItem.cart_id == Cart.id)
+    .correlate_except(CartItem, Product)
+    .scalar_subquery()
+)
+
+
 # -------------------------------------------------------------------------- #
 #                           MODELOS DE PEDIDO                                #
 # -------------------------------------------------------------------------- #
@@ -6,6 +6,7 @@ obtenção de tokens de acesso (login) e os endpoints para que um usuário
 autenticado gerencie seu próprio perfil.
 """
 
+import logging
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -24,6 +25,8 @@ router = APIRouter(
     tags=["Authentication"],
 )
 
+log = logging.getLogger(__name__)
+
 
 # -------------------------------------------------------------------------- #
 #                        AUTHENTICATION API ENDPOINTS                        #
@@ -101,7 +104,7 @@ def forgot_password(
     if user:
         reset_token = auth.create_password_reset_token()
         crud.create_password_reset_token(db, email=user.email, token=reset_token)
-        print(f"Password reset token for {user.email}: {reset_token}")
+        log.debug("Token de recuperação de senha gerado para %s.", user.email)
         return {
             "detail": "If an account with this email exists, a password reset link has been sent.",
             "token": reset_token,
@@ -11,7 +11,8 @@ estoque antes de qualquer operação no banco de dados.
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from .. import auth, crud, models, schemas
@@ -27,6 +28,10 @@ router = APIRouter(
     dependencies=[Depends(auth.get_current_user)],
 )
 
+# Adaptador criado uma única vez para reutilizar o validador e o serializador
+# (em Rust) do pydantic-core em todas as leituras do carrinho.
+_CART_ADAPTER = TypeAdapter(schemas.Cart)
+
 
 # -------------------------------------------------------------------------- #
 #                        SHOPPING CART API ENDPOINTS                         #
@@ -53,7 +58,12 @@ def read_my_cart(
         db.add(cart)
         db.commit()
         db.refresh(cart)
-    return cart
+    return Response(
+        content=_CART_ADAPTER.dump_json(
+            _CART_ADAPTER.validate_python(cart, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/items/", response_model=schemas.CartItem)
@@ -11,11 +11,12 @@ protegidos para administradores gerenciarem todos os pedidos.
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from typing import List
+from typing import Iterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.orm import Session
 
 from .. import auth, crud, models, schemas
 from ..database import get_db
@@ -30,6 +31,11 @@ router = APIRouter(
     dependencies=[Depends(auth.get_current_user)],
 )
 
+# Adaptadores criados uma única vez para reutilizar o validador e o serializador
+# (em Rust) do pydantic-core em todas as requisições de listagem.
+_ORDER_ADAPTER = TypeAdapter(schemas.Order)
+_ADMIN_ORDER_LIST_ADAPTER = TypeAdapter(List[schemas.AdminOrder])
+
 # -------------------------------------------------------------------------- #
 #                       SCHEMAS ESPECÍFICOS PARA ESTA ROTA                   #
 # -------------------------------------------------------------------------- #
@@ -41,6 +47,31 @@ class StatusUpdate(BaseModel):
     status: str
 
 
+# -------------------------------------------------------------------------- #
+#                           FUNÇÕES AUXILIARES                               #
+# -------------------------------------------------------------------------- #
+
+
+def _stream_orders(orders: Iterator[models.Order]) -> Iterator[bytes]:
+    """
+    Gera um array JSON de pedidos, um pedido por vez.
+
+    Se a leitura ou a serialização falhar no meio do streaming, o status 200
+    já foi enviado: a exceção propaga, a conexão é abortada e o cliente
+    recebe um corpo truncado (JSON inválido). Nesse caso o `]` final nunca é
+    enviado, e a falha não é tratada para fechar o array, para que uma lista
+    parcial nunca pareça completa. Sem erros, o array é sempre fechado.
+    """
+    yield b"["
+    for index, order in enumerate(orders):
+        if index:
+            yield b","
+        yield _ORDER_ADAPTER.dump_json(
+            _ORDER_ADAPTER.validate_python(order, from_attributes=True)
+        )
+    yield b"]"
+
+
 # -------------------------------------------------------------------------- #
 #                          ENDPOINTS PARA CLIENTES                           #
 # -------------------------------------------------------------------------- #
@@ -75,8 +106,17 @@ def read_my_orders(
     current_user: models.User = Depends(auth.get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Retorna o histórico de todos os pedidos feitos pelo usuário atual."""
-    return crud.get_orders_by_user(db, user_id=current_user.id)
+    """
+    Retorna o histórico de todos os pedidos feitos pelo usuário atual.
+
+    A lista é enviada em streaming: cada pedido é serializado para JSON pelo
+    pydantic-core assim que é lido do banco, sem montar a lista inteira em
+    memória. A sessão de `get_db` precisa continuar aberta até o fim do
+    corpo, o que exige FastAPI >= 0.118 (dependências com `yield` só são
+    encerradas depois que a resposta é enviada).
+    """
+    orders = crud.iter_orders_by_user(db, user_id=current_user.id)
+    return StreamingResponse(_stream_orders(orders), media_type="application/json")
 
 
 @router.get("/{order_id}", response_model=schemas.Order)
@@ -117,9 +157,19 @@ def read_single_order(
 def read_all_orders_admin(
     skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
-    """[Admin] Retorna uma lista de todos os pedidos no sistema."""
+    """
+    [Admin] Retorna uma lista de todos os pedidos no sistema.
+
+    Assim como em `read_my_orders`, os campos `datetime` são serializados
+    pelo pydantic-core, sem passar pelo `isoformat()` do Python.
+    """
     orders = crud.get_all_orders(db, skip=skip, limit=limit)
-    return orders
+    return Response(
+        content=_ADMIN_ORDER_LIST_ADAPTER.dump_json(
+            _ADMIN_ORDER_LIST_ADAPTER.validate_python(orders, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.put(
@@ -144,15 +194,7 @@ def update_order_status_admin(
     order_in_db.status = status_update.status
     db.commit()
 
-    reloaded_order = (
-        db.query(models.Order)
-        .options(
-            joinedload(models.Order.customer),
-            joinedload(models.Order.items).joinedload(models.OrderItem.product),
-        )
-        .filter(models.Order.id == order_id)
-        .first()
-    )
+    reloaded_order = crud.get_order_with_details(db, order_id=order_id)
 
     if not reloaded_order:
         raise HTTPException(
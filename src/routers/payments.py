@@ -17,14 +17,17 @@ from stripe.checkout import Session as StripeSession
 
 from .. import crud
 from ..database import get_db
-from ..settings import settings
+from ..settings import get_settings
 
 # -------------------------------------------------------------------------- #
 #                             CONFIGURAÇÃO INICIAL                           #
 # -------------------------------------------------------------------------- #
-stripe.api_key = settings.STRIPE_SECRET_KEY
+stripe.api_key = get_settings().STRIPE_SECRET_KEY
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
+# Nome enviado ao Stripe para itens cujo produto foi excluído após a compra.
+DELETED_PRODUCT_NAME = "Produto Removido"
+
 
 # -------------------------------------------------------------------------- #
 #                 ENDPOINT DE CRIAÇÃO DE SESSÃO DE CHECKOUT                  #
@@ -41,29 +44,25 @@ async def create_checkout_session(order_id: int, db: Session = Depends(get_db)):
     if order.status == "paid":
         raise HTTPException(status_code=400, detail="Order has already been paid.")
 
-    line_items = []
-    for item in order.items:
-        line_items.append(
-            {
-                "price_data": {
-                    "currency": "brl",
-                    "product_data": {
-                        "name": item.product.name
-                        if item.product
-                        else "Produto Removido"
-                    },
-                    "unit_amount": int(item.price_at_purchase * 100),
-                },
-                "quantity": item.quantity,
-            }
-        )
-
+    line_items = [
+        {
+            "price_data": {
+                "currency": "brl",
+                "product_data": {"name": name or DELETED_PRODUCT_NAME},
+                "unit_amount": int(price * 100),
+            },
+            "quantity": quantity,
+        }
+        for quantity, name, price in crud.get_order_line_items(db, order.id)
+    ]
+
+    client_url = get_settings().CLIENT_URL
     try:
         checkout_session: StripeSession = stripe.checkout.Session.create(
             line_items=line_items,
             mode="payment",
-            success_url=f"{settings.CLIENT_URL}/payment-success?session_id={{CHECKOUT_SESSION_ID}}",
-            cancel_url=f"{settings.CLIENT_URL}/payment-cancelled",
+            success_url=f"{client_url}/payment-success?session_id={{CHECKOUT_SESSION_ID}}",
+            cancel_url=f"{client_url}/payment-cancelled",
             metadata={"order_id": str(order.id)},
         )
 
@@ -106,7 +105,7 @@ async def stripe_webhook(
         event = stripe.Webhook.construct_event(
             payload=payload,
             sig_header=stripe_signature,
-            secret=settings.STRIPE_WEBHOOK_SECRET,
+            secret=get_settings().STRIPE_WEBHOOK_SECRET,
         )
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid webhook payload")
@@ -134,6 +133,7 @@ async def stripe_webhook(
                     f"Pedido #{order_id_str} atualizado para 'paid' via webhook."
                 )
         except Exception as e:
+            db.rollback()
             logging.error(
                 f"Erro de DB ao processar webhook para order_id {order_id_str}: {e}"
             )
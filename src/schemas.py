@@ -13,7 +13,7 @@ utilizada para garantir a validade de documentos como o CPF.
 # -------------------------------------------------------------------------- #
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated
 
 from pydantic import (
     BaseModel,
@@ -34,7 +34,7 @@ class BannerBase(BaseModel):
 
     title: str = Field(..., max_length=200, description="Texto alternativo do banner (alt).")
     image_url: str = Field(..., description="URL da imagem do banner.")
-    link_url: Optional[str] = Field(None, description="URL de destino ao clicar no banner.")
+    link_url: str | None = Field(None, description="URL de destino ao clicar no banner.")
     position: int = Field(0, description="Ordem de exibição (menor para maior).")
     is_active: bool = Field(True, description="Indica se o banner deve ser exibido.")
 
@@ -48,11 +48,11 @@ class BannerCreate(BannerBase):
 class BannerUpdate(BaseModel):
     """Schema para a atualização parcial de um banner. Todos os campos são opcionais."""
 
-    title: Optional[str] = Field(None, max_length=200)
-    image_url: Optional[str] = None
-    link_url: Optional[str] = None
-    position: Optional[int] = None
-    is_active: Optional[bool] = None
+    title: str | None = Field(None, max_length=200)
+    image_url: str | None = None
+    link_url: str | None = None
+    position: int | None = None
+    is_active: bool | None = None
 
 
 class Banner(BannerBase):
@@ -72,7 +72,7 @@ class CouponBase(BaseModel):
 
     code: str = Field(..., max_length=20)
     discount_percent: float = Field(..., gt=0, le=100)
-    expires_at: Optional[datetime] = None
+    expires_at: datetime | None = None
     is_active: bool = True
 
 
@@ -85,10 +85,10 @@ class CouponCreate(CouponBase):
 class CouponUpdate(BaseModel):
     """Schema para atualização parcial de um cupom."""
 
-    code: Optional[str] = Field(None, max_length=20)
-    discount_percent: Optional[float] = Field(None, gt=0, le=100)
-    expires_at: Optional[datetime] = None
-    is_active: Optional[bool] = None
+    code: str | None = Field(None, max_length=20)
+    discount_percent: float | None = Field(None, gt=0, le=100)
+    expires_at: datetime | None = None
+    is_active: bool | None = None
 
 
 class Coupon(CouponBase):
@@ -124,7 +124,7 @@ class ProductReviewBase(BaseModel):
     """Schema base com os campos essenciais de uma avaliação de produto."""
 
     rating: int = Field(..., gt=0, le=5, description="Nota de 1 a 5 estrelas.")
-    comment: Optional[str] = Field(None, max_length=1000)
+    comment: str | None = Field(None, max_length=1000)
 
 
 class ProductReviewCreate(ProductReviewBase):
@@ -152,9 +152,9 @@ class ProductBase(BaseModel):
 
     sku: str
     name: str
-    image_url: Optional[str] = None
+    image_url: str | None = None
     price: float
-    description: Optional[str] = None
+    description: str | None = None
 
 
 class ProductCreate(ProductBase):
@@ -178,38 +178,38 @@ class ProductUpdate(BaseModel):
     incluindo os dados de logística.
     """
 
-    sku: Optional[str] = None
-    name: Optional[str] = None
-    price: Optional[float] = None
-    description: Optional[str] = None
-    stock: Optional[int] = None
-    category_id: Optional[int] = None
-    image_url: Optional[str] = None
-    weight_kg: Optional[float] = Field(None, gt=0)
-    height_cm: Optional[float] = Field(None, gt=0)
-    width_cm: Optional[float] = Field(None, gt=0)
-    length_cm: Optional[float] = Field(None, gt=0)
+    sku: str | None = None
+    name: str | None = None
+    price: float | None = None
+    description: str | None = None
+    stock: int | None = None
+    category_id: int | None = None
+    image_url: str | None = None
+    weight_kg: float | None = Field(None, gt=0)
+    height_cm: float | None = Field(None, gt=0)
+    width_cm: float | None = Field(None, gt=0)
+    length_cm: float | None = Field(None, gt=0)
 
 
 class CategoryCreate(BaseModel):
     """Schema para a criação de uma nova categoria."""
     title: str
-    description: Optional[str] = None
-    image_url: Optional[str] = None
+    description: str | None = None
+    image_url: str | None = None
 
 class CategoryUpdate(BaseModel):
     """Schema para a edição de uma categoria."""
-    title: Optional[str] = None
-    description: Optional[str] = None
-    image_url: Optional[str] = None
+    title: str | None = None
+    description: str | None = None
+    image_url: str | None = None
 
 class CategoryBase(BaseModel):
     """Schema base com os campos essenciais de uma categoria."""
 
     id: int
     title: str
-    description: Optional[str] = None
-    image_url: Optional[str] = None
+    description: str | None = None
+    image_url: str | None = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -226,18 +226,16 @@ class Product(ProductBase):
     height_cm: float
     width_cm: float
     length_cm: float
-    reviews: List[ProductReview] = []
+    reviews: list[ProductReview] = []
     model_config = ConfigDict(from_attributes=True)
 
 
 class Category(CategoryBase):
     """Schema de leitura para uma categoria, incluindo a lista de seus produtos."""
 
-    products: List[Product] = []
+    products: list[Product] = []
 
 
-Category.model_rebuild()
-
 # -------------------------------------------------------------------------- #
 #                         SCHEMAS DE CARRINHO DE COMPRAS                     #
 # -------------------------------------------------------------------------- #
@@ -277,16 +275,11 @@ class Cart(BaseModel):
     """Schema principal de leitura para o carrinho de um usuário."""
 
     id: int
-    items: List[CartItem] = []
-    coupon: Optional[Coupon] = None
-
-    @computed_field
-    @property
-    def subtotal(self) -> float:
-        """Calcula o preço total do carrinho (subtotal) sem descontos."""
-        return sum(
-            item.product.price * item.quantity for item in self.items if item.product
-        )
+    items: Annotated[list[CartItem], Field(strict=True)] = []
+    coupon: Coupon | None = None
+    subtotal: float = Field(
+        0.0, description="Preço total sem descontos, calculado pelo banco de dados."
+    )
 
     @computed_field
     @property
@@ -315,25 +308,20 @@ class OrderItem(BaseModel):
 
     quantity: int
     price_at_purchase: float
-    product: Optional[Product]
+    product: Product | None
     model_config = ConfigDict(from_attributes=True)
 
 
-class OrderBase(BaseModel):
-    """Schema base com os campos essenciais de um pedido."""
+class Order(BaseModel):
+    """Schema principal de leitura para um pedido de um usuário."""
 
     id: int
     created_at: datetime
     total_price: float
     status: str
     discount_amount: float
-    coupon_code_used: Optional[str] = None
-    items: List[OrderItem] = []
-
-
-class Order(OrderBase):
-    """Schema principal de leitura para um pedido de um usuário."""
-
+    coupon_code_used: str | None = None
+    items: Annotated[list[OrderItem], Field(strict=True)] = []
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -351,7 +339,7 @@ class UserBase(BaseModel):
     phone: str
     address_street: str
     address_number: str
-    address_complement: Optional[str] = None
+    address_complement: str | None = None
     address_zip: str
     address_city: str
     address_state: str
@@ -384,14 +372,14 @@ class UserUpdate(BaseModel):
     por esta rota para manter a integridade da identificação do usuário.
     """
 
-    full_name: Optional[str] = None
-    phone: Optional[str] = None
-    address_street: Optional[str] = None
-    address_number: Optional[str] = None
-    address_complement: Optional[str] = None
-    address_zip: Optional[str] = None
-    address_city: Optional[str] = None
-    address_state: Optional[str] = None
+    full_name: str | None = None
+    phone: str | None = None
+    address_street: str | None = None
+    address_number: str | None = None
+    address_complement: str | None = None
+    address_zip: str | None = None
+    address_city: str | None = None
+    address_state: str | None = None
 
 
 class AdminUserUpdate(UserUpdate):
@@ -402,8 +390,8 @@ class AdminUserUpdate(UserUpdate):
     `is_active` e `is_superuser`.
     """
 
-    is_active: Optional[bool] = None
-    is_superuser: Optional[bool] = None
+    is_active: bool | None = None
+    is_superuser: bool | None = None
 
 
 class User(UserBase):
@@ -412,7 +400,7 @@ class User(UserBase):
     id: int
     is_superuser: bool
     is_active: bool
-    orders: List[Order] = []
+    orders: list[Order] = []
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -433,7 +421,7 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     """Schema para os dados decodificados de dentro de um token JWT."""
 
-    email: Optional[str] = None
+    email: str | None = None
 
 
 class ForgotPasswordRequest(BaseModel):
@@ -22,7 +22,7 @@ import requests
 from requests.exceptions import RequestException
 
 from .. import models
-from ..settings import settings
+from ..settings import get_settings
 
 # -------------------------------------------------------------------------- #
 #                            CONFIGURAÇÃO E CONSTANTES                       #
@@ -120,6 +120,7 @@ def calculate_shipping_options(
     if not package:
         return []
 
+    settings = get_settings()
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -9,12 +9,17 @@ Para interoperabilidade com o Pytest, o módulo detecta se está sendo executado
 no contexto de teste (`"pytest" in sys.modules`). Se estiver, ele ignora a
 leitura do arquivo .env e depende exclusivamente das variáveis de ambiente,
 que são fornecidas pelo `conftest.py`.
+
+As configurações são carregadas sob demanda e uma única vez por processo
+através de `get_settings()`. O atributo `settings` do módulo continua
+disponível por compatibilidade e delega para a mesma instância em cache.
 """
 
 # -------------------------------------------------------------------------- #
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional  # noqa: F401
 from pydantic import Field, PostgresDsn, computed_field, ValidationError
@@ -44,8 +49,9 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
 
     @computed_field
-    @property
+    @cached_property
     def DATABASE_URL(self) -> PostgresDsn:
+        """DSN do PostgreSQL, montado uma única vez por instância de `Settings`."""
         return PostgresDsn.build(
             scheme="postgresql",
             username=self.POSTGRES_USER,
@@ -90,4 +96,20 @@ def load_settings() -> Settings:
         ) from e
 
 
-settings = load_settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Retorna as configurações da aplicação, validadas uma única vez.
+
+    A leitura do .env e a validação do Pydantic ocorrem apenas na primeira
+    chamada; as seguintes reutilizam a mesma instância. Use
+    `get_settings.cache_clear()` para forçar um novo carregamento.
+    """
+    return load_settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Mantém `from .settings import settings` funcionando de forma preguiçosa."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,16 +7,20 @@ Ele é responsável por:
     para satisfazer o módulo de configurações da aplicação (`src/settings.py`)
     durante a inicialização do pytest. Isso é feito no nível do módulo, ANTES
     de qualquer importação de `src`.
-2.  Configurar um banco de dados de teste isolado em memória (SQLite) para
-    cada função de teste, garantindo que os testes não interfiram uns com os
-    outros.
-3.  Criar um cliente de teste da aplicação FastAPI (`TestClient`) com a
-    dependência de banco de dados sobrescrita para usar o banco de teste.
+2.  Configurar um banco de dados de teste em memória (SQLite), cujo esquema
+    é criado uma única vez por sessão; cada função de teste roda dentro de
+    uma transação desfeita ao final, garantindo que os testes não interfiram
+    uns com os outros.
+3.  Criar um único cliente de teste da aplicação FastAPI (`TestClient`) por
+    sessão e, a cada teste, sobrescrever a dependência de banco de dados
+    para usar sessões ligadas à transação do teste.
 4.  Fornecer 'payloads' de dados (dicionários) para a criação de usuários
     comuns e superusuários, incluindo todos os campos de perfil obrigatórios.
 5.  Criar usuários (comum e superusuário) e gerar tokens de autenticação
     para serem usados em testes de endpoints protegidos. A fixture de criação
     de usuário é idempotente para evitar falhas em execuções repetidas.
+6.  Criar uma categoria e um produto de teste diretamente pela camada CRUD,
+    reaproveitados pelos cenários que precisam de um catálogo mínimo.
 """
 
 # -------------------------------------------------------------------------- #
@@ -39,12 +43,29 @@ os.environ["STORE_ORIGIN_CEP"] = "01001000"
 
 
 import pytest
-from typing import Dict, Generator
+import pytest_asyncio
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Tuple,
+)
 
 from fastapi.testclient import TestClient
-from sqlalchemy import StaticPool, create_engine
+from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
+from pydantic import TypeAdapter
+from sqlalchemy import Engine, StaticPool, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
+from src import auth as auth_module
 from src import crud, models, schemas
 from src.auth import create_access_token
 from src.database import Base, get_db
@@ -62,7 +83,38 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessão usada pelos testes e fixtures para preparar os dados.
+# `expire_on_commit=False`: os objetos mantêm seus atributos após cada `commit`
+# (que nos testes apenas libera um SAVEPOINT), evitando um novo SELECT a cada
+# acesso. Os testes que precisam do estado gravado por uma rota usam
+# `db_session.expire_all()` antes de consultar.
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Sessão entregue à aplicação pela dependência `get_db`, com a mesma
+# configuração do `SessionLocal` de produção (`expire_on_commit=True`), para
+# que as rotas tenham, nos testes, a mesma semântica após cada `commit`.
+AppTestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Reutiliza o mesmo `SchemaValidator` de `UserCreate` em todas as fixtures.
+_USER_CREATE_ADAPTER = TypeAdapter(UserCreate)
+
+# Validade dos tokens memorizados por `_token_for`.
+_TOKEN_EXPIRES_DELTA = timedelta(days=1)
+
+
+# O driver `pysqlite` gerencia transações por conta própria e não emite
+# `BEGIN` antes de um `SAVEPOINT`. Estes eventos devolvem esse controle ao
+# SQLAlchemy, permitindo o isolamento por `SAVEPOINT` usado em `db_session`.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transaction_handling(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 # -------------------------------------------------------------------------- #
@@ -70,48 +122,136 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 # -------------------------------------------------------------------------- #
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing() -> Generator[None, None, None]:
+    """
+    Reduz o custo do bcrypt ao mínimo (4 rounds) durante os testes.
+
+    Os hashes continuam sendo bcrypt válidos, mas cada hash/verificação deixa
+    de custar centenas de milissegundos.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            auth_module,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def test_engine() -> Engine:
+    """Fornece a `engine` do banco de dados de teste em memória."""
+    return engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_schema() -> Generator[None, None, None]:
+    """Cria o esquema do banco de dados em memória uma única vez por sessão."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
-    """Cria e destrói um banco de dados em memória para cada função de teste."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    """
+    Fornece uma sessão isolada dentro de uma transação que é desfeita ao final
+    de cada teste.
+
+    Os `commit()` feitos pela aplicação apenas liberam um `SAVEPOINT`, de modo
+    que o `rollback()` da transação externa devolve o banco ao estado vazio sem
+    recriar as tabelas.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def query_counter() -> Generator[List[str], None, None]:
+    """
+    Registra as instruções SQL emitidas pelo engine de teste durante o teste.
+
+    Usado para detectar consultas N+1: o número de instruções de uma rota de
+    listagem não deve crescer com a quantidade de registros retornados.
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """
+    Cria o `TestClient` da aplicação uma única vez por sessão, executando o
+    `lifespan` do FastAPI apenas uma vez.
+    """
+    with TestClient(main_app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+def client(
+    app_client: TestClient, db_session: Session
+) -> Generator[TestClient, None, None]:
     """
-    Cria um cliente de teste para a aplicação FastAPI, sobrescrevendo a
-    dependência `get_db` para usar o banco de dados de teste em memória.
+    Fornece o cliente de teste compartilhado, sobrescrevendo a dependência
+    `get_db`. Cada requisição recebe a sua própria sessão, ligada à mesma
+    conexão (e transação) de `db_session`, como o `get_db` de produção.
     """
 
     def override_get_db():
+        db = AppTestingSessionLocal(
+            bind=db_session.bind, join_transaction_mode="create_savepoint"
+        )
         try:
-            yield db_session
+            yield db
         finally:
-            db_session.close()
+            db.close()
 
     main_app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(main_app) as test_client:
-        yield test_client
+    yield app_client
 
     main_app.dependency_overrides.clear()
+    app_client.cookies.clear()
+
+
+@pytest_asyncio.fixture
+async def async_client(client: TestClient) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Cliente HTTP assíncrono (`httpx.AsyncClient`) ligado diretamente à
+    aplicação via `ASGITransport`, com as mesmas dependências sobrescritas
+    pela fixture `client`.
+
+    As requisições devem ser aguardadas em sequência: todas compartilham a
+    mesma sessão de banco do teste, que não pode ser usada em paralelo.
+    """
+    transport = ASGITransport(app=main_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 # -------------------------------------------------------------------------- #
 #                 FIXTURES DE DADOS (PAYLOADS) PARA USUÁRIOS                 #
 # -------------------------------------------------------------------------- #
 
-
-@pytest.fixture(scope="session")
-def test_superuser_payload() -> Dict:
-    """Retorna um dicionário (payload) com dados completos para criar um superusuário."""
-    return {
+TEST_SUPERUSER_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
         "email": "admin@test.com",
         "password": "password123",
         "full_name": "Admin User",
@@ -124,12 +264,10 @@ def test_superuser_payload() -> Dict:
         "address_city": "Adminville",
         "address_state": "AD",
     }
+)
 
-
-@pytest.fixture(scope="session")
-def test_user_payload() -> Dict:
-    """Retorna um dicionário (payload) com dados completos para criar um usuário comum."""
-    return {
+TEST_USER_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
         "email": "user@test.com",
         "password": "password123",
         "full_name": "Common User",
@@ -142,6 +280,25 @@ def test_user_payload() -> Dict:
         "address_city": "Userville",
         "address_state": "US",
     }
+)
+
+
+@pytest.fixture(scope="session")
+def test_superuser_payload() -> Mapping[str, Any]:
+    """
+    Retorna o payload (somente leitura) com dados completos para criar um
+    superusuário. Para variações, use `{**payload, "campo": valor}`.
+    """
+    return TEST_SUPERUSER_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def test_user_payload() -> Mapping[str, Any]:
+    """
+    Retorna o payload (somente leitura) com dados completos para criar um
+    usuário comum. Para variações, use `{**payload, "campo": valor}`.
+    """
+    return TEST_USER_PAYLOAD
 
 
 # -------------------------------------------------------------------------- #
@@ -150,9 +307,9 @@ def test_user_payload() -> Dict:
 
 
 @pytest.fixture(scope="function")
-def test_superuser(db_session: Session, test_superuser_payload: Dict) -> models.User:
+def test_superuser(db_session: Session) -> models.User:
     """Cria um superusuário de teste diretamente no banco de dados e o retorna."""
-    user_schema = UserCreate(**test_superuser_payload)
+    user_schema = _USER_CREATE_ADAPTER.validate_python(TEST_SUPERUSER_PAYLOAD)
     user = crud.get_user_by_email(db_session, email=user_schema.email)
     if not user:
         user = crud.create_user(db=db_session, user=user_schema, is_superuser=True)
@@ -160,51 +317,101 @@ def test_superuser(db_session: Session, test_superuser_payload: Dict) -> models.
 
 
 @pytest.fixture(scope="function")
-def test_user(client: TestClient, test_user_payload: Dict, db_session: Session) -> Dict:
+def test_user(db_session: Session) -> Dict:
     """
-    Garante que um usuário comum exista e retorna seus dados.
+    Garante que um usuário comum exista e retorna seus dados serializados.
 
-    Tenta criar o usuário via API para testar o endpoint. Se o usuário já
-    existir (retorno 400), ele é buscado no banco. Isso torna a fixture
-    idempotente e resiliente a múltiplas chamadas.
+    O usuário é inserido diretamente pela camada CRUD, sem passar pela rota
+    de registro (testada em `test_auth.py`). Se ele já existir, é apenas
+    buscado no banco, o que torna a fixture idempotente.
     """
-    response = client.post("/auth/users/", json=test_user_payload)
+    user = crud.get_user_by_email(db_session, email=TEST_USER_PAYLOAD["email"])
+    if not user:
+        user = crud.create_user(
+            db=db_session, user=_USER_CREATE_ADAPTER.validate_python(TEST_USER_PAYLOAD)
+        )
+    return schemas.User.model_validate(user).model_dump(mode="json")
 
-    if response.status_code == 201:
-        return response.json()
 
-    if response.status_code == 400 and "already registered" in response.json().get(
-        "detail", ""
-    ):
-        user = crud.get_user_by_email(db_session, email=test_user_payload["email"])
-        assert user is not None
-        return schemas.User.model_validate(user).model_dump()
+@lru_cache(maxsize=64)
+def _cached_token(claims: Tuple[Tuple[str, Any], ...]) -> str:
+    """Assina um token para as `claims` (já ordenadas) uma única vez por sessão."""
+    return create_access_token(data=dict(claims), expires_delta=_TOKEN_EXPIRES_DELTA)
 
-    response.raise_for_status()
-    return {}
+
+def _token_for(**claims: Any) -> str:
+    """
+    Retorna um token de acesso com as `claims` informadas, reaproveitando o
+    token já assinado para as mesmas claims. A validade é longa o bastante
+    para toda a sessão de testes.
+    """
+    return _cached_token(tuple(sorted(claims.items())))
+
+
+@lru_cache(maxsize=64)
+def _auth_headers_for(email: str) -> Mapping[str, str]:
+    """
+    Retorna o cabeçalho de autenticação Bearer do usuário `email`. O mapa é
+    montado uma única vez por sessão e é imutável, para poder ser
+    compartilhado entre os testes sem risco de um deles alterá-lo.
+    """
+    return MappingProxyType({"Authorization": f"Bearer {_token_for(sub=email)}"})
+
+
+@pytest.fixture(scope="session")
+def token_for() -> Callable[..., str]:
+    """Fornece a função que gera tokens de acesso memorizados por `claims`."""
+    return _token_for
+
+
+@pytest.fixture(scope="session")
+def auth_headers_for() -> Callable[[str], Mapping[str, str]]:
+    """Fornece a função que gera o cabeçalho de autenticação de um e-mail."""
+    return _auth_headers_for
 
 
 @pytest.fixture(scope="function")
-def superuser_token_headers(test_superuser: models.User) -> Dict[str, str]:
+def superuser_token_headers(test_superuser: models.User) -> Mapping[str, str]:
     """Gera um cabeçalho de autenticação Bearer para o superusuário de teste."""
-    token = create_access_token(data={"sub": test_superuser.email})
-    return {"Authorization": f"Bearer {token}"}
+    return _auth_headers_for(test_superuser.email)
 
 
 @pytest.fixture(scope="function")
-def user_token_headers(client: TestClient, test_user_payload: Dict) -> Dict[str, str]:
+def user_token_headers(test_user: Dict) -> Mapping[str, str]:
     """
-    Garante que o usuário de teste exista, faz o login e gera o cabeçalho
-    de autenticação para o usuário comum.
+    Garante que o usuário de teste exista e gera o cabeçalho de autenticação
+    para o usuário comum, sem passar pelo endpoint de login.
     """
-    client.post("/auth/users/", json=test_user_payload)
+    return _auth_headers_for(test_user["email"])
 
-    login_data = {
-        "username": test_user_payload["email"],
-        "password": test_user_payload["password"],
-    }
-    response = client.post("/auth/token", data=login_data)
-    response.raise_for_status()
 
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+# -------------------------------------------------------------------------- #
+#                    FIXTURES DE CATÁLOGO (CATEGORIA/PRODUTO)                #
+# -------------------------------------------------------------------------- #
+
+
+@pytest.fixture(scope="function")
+def test_category(db_session: Session) -> models.Category:
+    """Cria uma categoria de teste diretamente pela camada CRUD."""
+    return crud.create_category(
+        db_session, schemas.CategoryCreate(title="Categoria de Teste")
+    )
+
+
+@pytest.fixture(scope="function")
+def test_product(db_session: Session, test_category: models.Category) -> models.Product:
+    """Cria um produto com estoque na categoria de teste, sem requisições HTTP."""
+    return crud.create_product(
+        db_session,
+        schemas.ProductCreate(
+            sku="TEST-PROD-001",
+            name="Produto de Teste",
+            price=99.99,
+            category_id=test_category.id,
+            stock=10,
+            weight_kg=1.0,
+            height_cm=10,
+            width_cm=10,
+            length_cm=10,
+        ),
+    )
@@ -15,12 +15,15 @@ privilégios de superusuário. Garante que:
 # -------------------------------------------------------------------------- #
 
 import pytest
-from typing import Dict, Any
+from datetime import datetime
+from typing import Any, Dict, List
 
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
+from validate_docbr import CPF
 
-from src.models import Order, User  # noqa: F401
+from src import crud, schemas
+from src.models import Category, Order, OrderItem, Product, ProductReview, User
 
 # -------------------------------------------------------------------------- #
 #                        FIXTURE AUXILIAR DE SETUP                           #
@@ -29,49 +32,86 @@ from src.models import Order, User  # noqa: F401
 
 @pytest.fixture(scope="function")
 def order_for_admin_tests(
-    client: TestClient,
-    user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
+    db_session: Session, test_user: Dict, test_product: Product
 ) -> Dict[str, Any]:
     """
     Fixture que cria um cenário completo para testes de administração:
-    Cria uma categoria, um produto com estoque, um usuário comum adiciona o
-    produto ao carrinho e, finalmente, cria um pedido.
+    um pedido pendente do usuário comum contendo uma unidade do produto de
+    teste.
+
+    O pedido e seu item são inseridos diretamente pelo ORM, com um único
+    `commit`; as rotas de carrinho e de criação de pedido já são testadas em
+    seus próprios módulos.
     """
-    cat_resp = client.post(
-        "/categories/",
-        headers=superuser_token_headers,
-        json={"title": "Admin Test Categ"},
+    order = Order(
+        user_id=test_user["id"],
+        total_price=test_product.price,
+        discount_amount=0.0,
+        status="pending_payment",
+        items=[
+            OrderItem(
+                product_id=test_product.id,
+                quantity=1,
+                price_at_purchase=test_product.price,
+            )
+        ],
     )
-    cat_resp.raise_for_status()
-    category_id = cat_resp.json()["id"]
-
-    prod_data = {
-        "sku": "ADM-TEST-001",
-        "name": "Produto para Teste Admin",
-        "price": 99.99,
-        "category_id": category_id,
-        "stock": 10,
-        "weight_kg": 1.0,
-        "height_cm": 10,
-        "width_cm": 10,
-        "length_cm": 10,
-    }
-    prod_resp = client.post(
-        "/products/", headers=superuser_token_headers, json=prod_data
+    db_session.add(order)
+    db_session.commit()
+    return schemas.Order.model_validate(order).model_dump(mode="json")
+
+
+def _create_customer_with_order(
+    db_session: Session, category: Category, index: int
+) -> None:
+    """
+    Cria um cliente com um pedido de um produto próprio, avaliado por ele.
+
+    Cada cliente usa produto e categoria de avaliação distintos, de modo que um
+    carregamento preguiçoso na serialização geraria uma consulta por registro.
+    """
+    customer = User(
+        email=f"n1.customer{index}@test.com",
+        hashed_password="not-used",
+        full_name=f"Cliente {index}",
+        cpf=CPF().generate(mask=True),
+        phone="(11) 90000-0000",
+        address_street="Rua N+1",
+        address_number=str(index),
+        address_zip="01001-000",
+        address_city="São Paulo",
+        address_state="SP",
+    )
+    product = Product(
+        sku=f"N1-{index}",
+        name=f"Produto N+1 {index}",
+        price=10.0,
+        category=category,
+        stock=5,
+        weight_kg=1.0,
+        height_cm=10,
+        width_cm=10,
+        length_cm=10,
     )
-    prod_resp.raise_for_status()
-    product_id = prod_resp.json()["id"]
+    order = Order(
+        customer=customer,
+        total_price=10.0,
+        discount_amount=0.0,
+        items=[OrderItem(product=product, quantity=1, price_at_purchase=10.0)],
+    )
+    review = ProductReview(product=product, author=customer, rating=5)
+    db_session.add_all([order, review])
+    db_session.commit()
 
-    client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 1},
-    ).raise_for_status()
 
-    order_response = client.post("/orders/", headers=user_token_headers)
-    assert order_response.status_code == 201
-    return order_response.json()
+def _count_request_queries(
+    client: TestClient, url: str, headers: Dict, query_counter: List[str]
+) -> int:
+    """Executa um GET e retorna quantas instruções SQL ele emitiu."""
+    query_counter.clear()
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    return len(query_counter)
 
 
 # -------------------------------------------------------------------------- #
@@ -153,8 +193,7 @@ def test_update_order_status_fails_on_reload(
     """
     order_id = order_for_admin_tests["id"]
 
-    mock_query = mocker.patch("sqlalchemy.orm.Session.query")
-    mock_query.return_value.options.return_value.filter.return_value.first.return_value = None
+    mocker.patch.object(crud, "get_order_with_details", return_value=None)
 
     response = client.put(
         f"/orders/{order_id}/status",
@@ -170,11 +209,18 @@ def test_superuser_can_list_all_orders(
     client: TestClient,
     superuser_token_headers: Dict,
     order_for_admin_tests: Dict,
+    db_session: Session,
 ):
     """Testa se um superusuário pode listar todos os pedidos no sistema."""
     response = client.get("/orders/admin/all", headers=superuser_token_headers)
     assert response.status_code == 200, response.text
-    assert any(order["id"] == order_for_admin_tests["id"] for order in response.json())
+    listed = next(
+        order for order in response.json() if order["id"] == order_for_admin_tests["id"]
+    )
+    order_in_db = db_session.get(Order, order_for_admin_tests["id"])
+    assert order_in_db is not None
+    assert datetime.fromisoformat(listed["created_at"]) == order_in_db.created_at
+    assert listed["customer"]["email"]
 
 
 def test_superuser_can_update_order_status(
@@ -239,3 +285,34 @@ def test_get_dashboard_stats_with_data(
 
     response_after = client.get("/admin/stats/", headers=superuser_token_headers)
     assert response_after.json()["total_sales"] == 99.99
+
+
+# -------------------------------------------------------------------------- #
+#                 TESTES DE REGRESSÃO DE CONSULTAS N+1                       #
+# -------------------------------------------------------------------------- #
+
+
+@pytest.mark.parametrize("url", ["/admin/users/", "/orders/admin/all"])
+def test_admin_listings_issue_constant_number_of_queries(
+    url: str,
+    client: TestClient,
+    superuser_token_headers: Dict,
+    db_session: Session,
+    test_category: Category,
+    query_counter: List[str],
+):
+    """
+    Testa se as listagens de administração emitem o mesmo número de consultas
+    com um ou vários registros (sem N+1 na serialização).
+    """
+    _create_customer_with_order(db_session, test_category, 0)
+    baseline = _count_request_queries(
+        client, url, superuser_token_headers, query_counter
+    )
+
+    for index in range(1, 4):
+        _create_customer_with_order(db_session, test_category, index)
+    assert (
+        _count_request_queries(client, url, superuser_token_headers, query_counter)
+        == baseline
+    )
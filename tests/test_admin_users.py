@@ -39,9 +39,11 @@ def user_for_admin_management(
     nos testes. Usa um e-mail diferente para evitar colisões com fixtures
     de `conftest`. Retorna o dicionário completo do usuário criado.
     """
-    payload = test_user_payload.copy()
-    payload["email"] = "manage.me@test.com"
-    payload["cpf"] = "32517495017"  
+    payload = {
+        **test_user_payload,
+        "email": "manage.me@test.com",
+        "cpf": "32517495017",
+    }
 
     response = client.post("/auth/users/", json=payload)
     response.raise_for_status()
@@ -17,24 +17,29 @@ alteração de senha. Garante que:
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from typing import Dict
+from typing import Callable, Dict
 
-from fastapi.testclient import TestClient
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
 
-from src.auth import create_access_token
+from src.auth import get_current_user
 
 # -------------------------------------------------------------------------- #
 #                       TESTES DE REGISTRO DE USUÁRIO                        #
 # -------------------------------------------------------------------------- #
 
 
-def test_create_user_success(client: TestClient, test_user_payload: Dict):
+async def test_create_user_success(async_client: AsyncClient, test_user_payload: Dict):
     """Testa o registro bem-sucedido de um novo usuário com dados completos."""
-    payload = test_user_payload.copy()
-    payload["email"] = "register_success@test.com"
-    payload["cpf"] = "53043260082"
+    payload = {
+        **test_user_payload,
+        "email": "register_success@test.com",
+        "cpf": "53043260082",
+    }
 
-    response = client.post("/auth/users/", json=payload)
+    response = await async_client.post("/auth/users/", json=payload)
     assert response.status_code == 201, response.text
 
     created_user = response.json()
@@ -43,22 +48,22 @@ def test_create_user_success(client: TestClient, test_user_payload: Dict):
     assert not created_user["is_superuser"]
 
 
-def test_create_user_with_missing_field_fails(
-    client: TestClient, test_user_payload: Dict
+async def test_create_user_with_missing_field_fails(
+    async_client: AsyncClient, test_user_payload: Dict
 ):
     """Testa a falha de registro ao omitir um campo obrigatório (ex: full_name)."""
     payload = test_user_payload.copy()
     payload.pop("full_name")
 
-    response = client.post("/auth/users/", json=payload)
+    response = await async_client.post("/auth/users/", json=payload)
     assert response.status_code == 422
 
 
-def test_create_user_with_existing_email(
-    client: TestClient, test_user: Dict, test_user_payload: Dict
+async def test_create_user_with_existing_email(
+    async_client: AsyncClient, test_user: Dict, test_user_payload: Dict
 ):
     """Testa a falha ao registrar um usuário com um e-mail que já existe."""
-    response = client.post("/auth/users/", json=test_user_payload)
+    response = await async_client.post("/auth/users/", json=dict(test_user_payload))
     assert response.status_code == 400, response.text
     assert response.json()["detail"] == "Email already registered"
 
@@ -68,15 +73,15 @@ def test_create_user_with_existing_email(
 # -------------------------------------------------------------------------- #
 
 
-def test_login_for_access_token_success(
-    client: TestClient, test_user: Dict, test_user_payload: Dict
+async def test_login_for_access_token_success(
+    async_client: AsyncClient, test_user: Dict, test_user_payload: Dict
 ):
     """Testa o login bem-sucedido com credenciais corretas."""
     login_data = {
         "username": test_user_payload["email"],
         "password": test_user_payload["password"],
     }
-    response = client.post("/auth/token", data=login_data)
+    response = await async_client.post("/auth/token", data=login_data)
 
     assert response.status_code == 200
     token_data = response.json()
@@ -84,10 +89,10 @@ def test_login_for_access_token_success(
     assert token_data["token_type"] == "bearer"
 
 
-def test_login_with_wrong_password(client: TestClient, test_user: Dict):
+async def test_login_with_wrong_password(async_client: AsyncClient, test_user: Dict):
     """Testa a falha de login ao fornecer a senha incorreta."""
     login_data = {"username": test_user["email"], "password": "wrongpassword"}
-    response = client.post("/auth/token", data=login_data)
+    response = await async_client.post("/auth/token", data=login_data)
 
     assert response.status_code == 401
     assert "Incorrect email or password" in response.json()["detail"]
@@ -98,11 +103,11 @@ def test_login_with_wrong_password(client: TestClient, test_user: Dict):
 # -------------------------------------------------------------------------- #
 
 
-def test_read_users_me_success(
-    client: TestClient, user_token_headers: Dict, test_user: Dict
+async def test_read_users_me_success(
+    async_client: AsyncClient, user_token_headers: Dict, test_user: Dict
 ):
     """Testa se um usuário autenticado pode acessar seus próprios dados."""
-    response = client.get("/auth/users/me/", headers=user_token_headers)
+    response = await async_client.get("/auth/users/me/", headers=user_token_headers)
     assert response.status_code == 200
 
     profile_data = response.json()
@@ -111,14 +116,16 @@ def test_read_users_me_success(
     assert profile_data["full_name"] == test_user["full_name"]
 
 
-def test_update_user_me_success(client: TestClient, user_token_headers: Dict):
+async def test_update_user_me_success(
+    async_client: AsyncClient, user_token_headers: Dict
+):
     """Testa se um usuário autenticado pode atualizar seus dados de perfil."""
     update_payload = {
         "full_name": "New Updated Name",
         "address_street": "New Updated Street",
         "phone": "(99) 99999-9999",
     }
-    response = client.put(
+    response = await async_client.put(
         "/auth/users/me/", headers=user_token_headers, json=update_payload
     )
 
@@ -129,14 +136,16 @@ def test_update_user_me_success(client: TestClient, user_token_headers: Dict):
     assert updated_user["phone"] == update_payload["phone"]
 
 
-def test_update_user_me_unauthenticated(client: TestClient):
+async def test_update_user_me_unauthenticated(async_client: AsyncClient):
     """Testa a falha ao tentar atualizar o perfil sem autenticação."""
-    response = client.put("/auth/users/me/", json={"full_name": "Fail Name"})
+    response = await async_client.put(
+        "/auth/users/me/", json={"full_name": "Fail Name"}
+    )
     assert response.status_code == 401
 
 
-def test_update_password_success_and_relogin(
-    client: TestClient,
+async def test_update_password_success_and_relogin(
+    async_client: AsyncClient,
     test_user: Dict,
     user_token_headers: Dict,
     test_user_payload: Dict,
@@ -150,13 +159,13 @@ def test_update_password_success_and_relogin(
         "current_password": test_user_payload["password"],
         "new_password": new_password,
     }
-    response = client.put(
+    response = await async_client.put(
         "/auth/users/me/password", headers=user_token_headers, json=password_payload
     )
     assert response.status_code == 200
     assert response.json() == {"message": "Password updated successfully."}
 
-    old_login_resp = client.post(
+    old_login_resp = await async_client.post(
         "/auth/token",
         data={
             "username": test_user["email"],
@@ -165,7 +174,7 @@ def test_update_password_success_and_relogin(
     )
     assert old_login_resp.status_code == 401
 
-    new_login_resp = client.post(
+    new_login_resp = await async_client.post(
         "/auth/token",
         data={"username": test_user["email"], "password": new_password},
     )
@@ -173,15 +182,15 @@ def test_update_password_success_and_relogin(
     assert "access_token" in new_login_resp.json()
 
 
-def test_update_password_with_wrong_current_password(
-    client: TestClient, user_token_headers: Dict
+async def test_update_password_with_wrong_current_password(
+    async_client: AsyncClient, user_token_headers: Dict
 ):
     """Testa a falha ao tentar atualizar a senha fornecendo a senha atual incorreta."""
     password_payload = {
         "current_password": "this_is_wrong_password",
         "new_password": "it_doesnt_matter",
     }
-    response = client.put(
+    response = await async_client.put(
         "/auth/users/me/password", headers=user_token_headers, json=password_payload
     )
     assert response.status_code == 400
@@ -193,32 +202,38 @@ def test_update_password_with_wrong_current_password(
 # -------------------------------------------------------------------------- #
 
 
-def test_read_users_me_with_invalid_token_format(client: TestClient):
-    """Testa o acesso com um token Bearer malformado."""
-    headers = {"Authorization": "Bearer not-a-valid-jwt"}
-    response = client.get("/auth/users/me/", headers=headers)
-    assert response.status_code == 401
+# Estes testes chamam a dependência `get_current_user` diretamente, sem
+# passar pelo roteamento do FastAPI, pois só exercitam a decodificação do JWT.
+
+
+async def _assert_rejected(db_session: Session, token: str) -> None:
+    """Verifica se `get_current_user` rejeita o token com 401."""
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_user(db=db_session, token=token)
+    assert excinfo.value.status_code == 401
+    assert "Could not validate credentials" in excinfo.value.detail
 
 
-def test_get_current_user_with_token_missing_sub(client: TestClient):
+async def test_get_current_user_rejects_malformed_token(db_session: Session):
+    """Testa a rejeição de um token Bearer malformado."""
+    await _assert_rejected(db_session, "not-a-valid-jwt")
+
+
+async def test_get_current_user_rejects_token_missing_sub(
+    db_session: Session, token_for: Callable[..., str]
+):
     """Testa a falha com um token JWT válido, mas sem o campo 'sub'."""
-    token = create_access_token(data={"user_id": 123})
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/auth/users/me/", headers=headers)
-    assert response.status_code == 401, response.text
-    assert "Could not validate credentials" in response.json()["detail"]
+    await _assert_rejected(db_session, token_for(user_id=123))
 
 
-def test_get_current_user_with_nonexistent_user_in_db(client: TestClient):
+async def test_get_current_user_rejects_token_for_unknown_user(
+    db_session: Session, token_for: Callable[..., str]
+):
     """
     Testa a falha com um token JWT válido para um usuário que não existe
     (ou foi deletado) do banco de dados.
     """
-    token = create_access_token(data={"sub": "ghost.user@example.com"})
-    headers = {"Authorization": f"Bearer {token}"}
-    response = client.get("/auth/users/me/", headers=headers)
-    assert response.status_code == 401, response.text
-    assert "Could not validate credentials" in response.json()["detail"]
+    await _assert_rejected(db_session, token_for(sub="ghost.user@example.com"))
 
 
 # -------------------------------------------------------------------------- #
@@ -226,13 +241,17 @@ def test_get_current_user_with_nonexistent_user_in_db(client: TestClient):
 # -------------------------------------------------------------------------- #
 
 
-def test_create_user_with_invalid_cpf(client: TestClient, test_user_payload: Dict):
+async def test_create_user_with_invalid_cpf(
+    async_client: AsyncClient, test_user_payload: Dict
+):
     """Testa a falha ao registrar um usuário com um CPF matematicamente inválido."""
-    payload = test_user_payload.copy()
-    payload["email"] = "invalid.cpf@test.com"
-    payload["cpf"] = "111.111.111-11"
+    payload = {
+        **test_user_payload,
+        "email": "invalid.cpf@test.com",
+        "cpf": "111.111.111-11",
+    }
 
-    response = client.post("/auth/users/", json=payload)
+    response = await async_client.post("/auth/users/", json=payload)
 
     assert response.status_code == 422, response.text
 
@@ -13,15 +13,15 @@ Testa todos os endpoints sob o prefixo '/cart', cobrindo:
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from typing import Dict
+from functools import partial
+from typing import Awaitable, Callable, Dict, Mapping
 
 import pytest
-from fastapi.testclient import TestClient
-from httpx import Response
+from httpx import AsyncClient, Response
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
-from src import models, crud
-from src.auth import create_access_token
+from src import crud, models, schemas
 from src.schemas import UserCreate
 
 # -------------------------------------------------------------------------- #
@@ -30,30 +30,74 @@ from src.schemas import UserCreate
 
 
 @pytest.fixture
-def product_for_cart_tests(client: TestClient, superuser_token_headers: Dict) -> Dict:
-    """Fixture para criar uma categoria e um produto com estoque para testes."""
-    cat_resp = client.post(
-        "/categories/",
-        headers=superuser_token_headers,
-        json={"title": "Carrinho Categ"},
-    )
-    cat_resp.raise_for_status()
-    prod_data = {
-        "sku": "PROD-CART-001",
-        "name": "Item Teste Carrinho",
-        "price": 10.99,
-        "category_id": cat_resp.json()["id"],
-        "stock": 5,
-        "weight_kg": 0.2,
-        "height_cm": 5,
-        "width_cm": 10,
-        "length_cm": 15,
-    }
-    prod_resp = client.post(
-        "/products/", headers=superuser_token_headers, json=prod_data
+def product_for_cart_tests(db_session: Session) -> Dict:
+    """
+    Fixture para criar uma categoria e um produto com estoque para testes.
+
+    Ambos são inseridos diretamente pelo ORM em uma única transação, sem
+    passar pelas rotas de catálogo; retorna o produto no formato da API.
+    """
+    category = models.Category(title="Carrinho Categ")
+    product = models.Product(
+        sku="PROD-CART-001",
+        name="Item Teste Carrinho",
+        price=10.99,
+        category=category,
+        stock=5,
+        weight_kg=0.2,
+        height_cm=5,
+        width_cm=10,
+        length_cm=15,
     )
-    prod_resp.raise_for_status()
-    return prod_resp.json()
+    db_session.add(product)
+    db_session.commit()
+    return schemas.Product.model_validate(product).model_dump(mode="json")
+
+
+@pytest.fixture
+def add_item(
+    async_client: AsyncClient, user_token_headers: Dict
+) -> Callable[..., Awaitable[Response]]:
+    """Fixture com o `POST /cart/items/` do usuário comum já parametrizado."""
+    return partial(async_client.post, "/cart/items/", headers=user_token_headers)
+
+
+@pytest.fixture
+def get_cart(
+    async_client: AsyncClient, user_token_headers: Dict
+) -> Callable[[], Awaitable[Response]]:
+    """Fixture com o `GET /cart/` do usuário comum já parametrizado."""
+    return partial(async_client.get, "/cart/", headers=user_token_headers)
+
+
+@pytest.fixture
+def put_item(
+    async_client: AsyncClient, user_token_headers: Dict
+) -> Callable[..., Awaitable[Response]]:
+    """Fixture que atualiza a quantidade de um produto no carrinho do usuário."""
+
+    async def _put_item(product_id: int, quantity: int) -> Response:
+        return await async_client.put(
+            f"/cart/items/{product_id}",
+            headers=user_token_headers,
+            json={"quantity": quantity},
+        )
+
+    return _put_item
+
+
+@pytest.fixture
+def del_item(
+    async_client: AsyncClient, user_token_headers: Dict
+) -> Callable[..., Awaitable[Response]]:
+    """Fixture que remove um produto do carrinho do usuário."""
+
+    async def _del_item(product_id: int) -> Response:
+        return await async_client.delete(
+            f"/cart/items/{product_id}", headers=user_token_headers
+        )
+
+    return _del_item
 
 
 # -------------------------------------------------------------------------- #
@@ -61,29 +105,33 @@ def product_for_cart_tests(client: TestClient, superuser_token_headers: Dict) ->
 # -------------------------------------------------------------------------- #
 
 
-def test_superuser_has_no_cart(client: TestClient, superuser_token_headers: Dict):
+async def test_superuser_has_no_cart(
+    async_client: AsyncClient, superuser_token_headers: Dict
+):
     """Testa se superusuários não podem acessar o endpoint do carrinho (espera 403)."""
-    response = client.get("/cart/", headers=superuser_token_headers)
+    response = await async_client.get("/cart/", headers=superuser_token_headers)
     assert response.status_code == 403, response.text
     assert "Superusuários não possuem carrinho de compras" in response.json()["detail"]
 
 
-def test_superuser_cannot_add_or_update_cart(
-    client: TestClient, superuser_token_headers: Dict, product_for_cart_tests: Dict
+async def test_superuser_cannot_add_or_update_cart(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    product_for_cart_tests: Dict,
 ):
     """
     Testa se o superusuário é proibido de adicionar ou atualizar itens,
     cobrirá as linhas que faltavam nessas rotas.
     """
     product_id = product_for_cart_tests["id"]
-    add_response = client.post(
+    add_response = await async_client.post(
         "/cart/items/",
         headers=superuser_token_headers,
         json={"product_id": 1, "quantity": 1},
     )
     assert add_response.status_code == 403
 
-    update_response = client.put(
+    update_response = await async_client.put(
         f"/cart/items/{product_id}",
         headers=superuser_token_headers,
         json={"quantity": 1},
@@ -91,19 +139,22 @@ def test_superuser_cannot_add_or_update_cart(
     assert update_response.status_code == 403
 
 
-def test_read_cart_when_cart_is_missing(client: TestClient, db_session, test_user):
+async def test_read_cart_when_cart_is_missing(
+    async_client: AsyncClient,
+    db_session,
+    test_user,
+    auth_headers_for: Callable[[str], Mapping[str, str]],
+):
     """Testa o caso raro de um usuário não ter um carrinho associado."""
-    user_in_db = crud.get_user_by_email(db_session, test_user["email"])
-    assert user_in_db is not None
-    assert user_in_db.cart is not None
-
-    user_token = create_access_token(data={"sub": user_in_db.email})
-    headers = {"Authorization": f"Bearer {user_token}"}
-
-    db_session.delete(user_in_db.cart)
+    result = db_session.execute(
+        delete(models.Cart).where(models.Cart.user_id == test_user["id"])
+    )
     db_session.commit()
+    assert result.rowcount == 1
 
-    response = client.get("/cart/", headers=headers)
+    headers = auth_headers_for(test_user["email"])
+
+    response = await async_client.get("/cart/", headers=headers)
     assert response.status_code == 200
     assert "id" in response.json()
 
@@ -113,81 +164,55 @@ def test_read_cart_when_cart_is_missing(client: TestClient, db_session, test_use
 # -------------------------------------------------------------------------- #
 
 
-def test_add_item_to_cart_success(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_add_item_to_cart_success(
+    add_item: Callable, get_cart: Callable, product_for_cart_tests: Dict
 ):
     """Testa adicionar com sucesso um item ao carrinho (dentro do limite de estoque)."""
     product_id = product_for_cart_tests["id"]
 
-    response = client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 2},
-    )
+    response = await add_item(json={"product_id": product_id, "quantity": 2})
     assert response.status_code == 200, response.text
 
-    response_2 = client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 3},
-    )
+    response_2 = await add_item(json={"product_id": product_id, "quantity": 3})
     assert response_2.status_code == 200, response_2.text
 
-    cart_resp = client.get("/cart/", headers=user_token_headers)
-    assert cart_resp.json()["items"][0]["quantity"] == 5
+    cart_resp = await get_cart()
+    cart_json = cart_resp.json()
+    assert cart_json["items"][0]["quantity"] == 5
+    assert cart_json["subtotal"] == pytest.approx(5 * 10.99)
 
 
-def test_add_item_to_cart_insufficient_stock(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_add_item_to_cart_insufficient_stock(
+    add_item: Callable, product_for_cart_tests: Dict
 ):
     """Testa a falha ao tentar adicionar um item que excede o estoque disponível."""
     product_id = product_for_cart_tests["id"]
 
-    response = client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 6},
-    )
+    response = await add_item(json={"product_id": product_id, "quantity": 6})
     assert response.status_code == 400, response.text
     assert "Estoque insuficiente" in response.json()["detail"]
 
 
-def test_update_cart_item_quantity_success(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_update_cart_item_quantity_success(
+    add_item: Callable, put_item: Callable, product_for_cart_tests: Dict
 ):
     """Testa a atualização bem-sucedida da quantidade de um item no carrinho."""
     product_id = product_for_cart_tests["id"]
-    client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 1},
-    ).raise_for_status()
+    (await add_item(json={"product_id": product_id, "quantity": 1})).raise_for_status()
 
-    update_response = client.put(
-        f"/cart/items/{product_id}",
-        headers=user_token_headers,
-        json={"quantity": 4},
-    )
+    update_response = await put_item(product_id, 4)
     assert update_response.status_code == 200, update_response.text
     assert update_response.json()["quantity"] == 4
 
 
-def test_update_cart_item_insufficient_stock(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_update_cart_item_insufficient_stock(
+    add_item: Callable, put_item: Callable, product_for_cart_tests: Dict
 ):
     """Testa a falha ao atualizar a quantidade para um valor maior que o estoque."""
     product_id = product_for_cart_tests["id"]
-    client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 1},
-    ).raise_for_status()
+    (await add_item(json={"product_id": product_id, "quantity": 1})).raise_for_status()
 
-    update_response = client.put(
-        f"/cart/items/{product_id}",
-        headers=user_token_headers,
-        json={"quantity": 6},
-    )
+    update_response = await put_item(product_id, 6)
     assert update_response.status_code == 404, update_response.text
     assert (
         "Item não encontrado no carrinho ou estoque insuficiente"
@@ -200,27 +225,23 @@ def test_update_cart_item_insufficient_stock(
 # -------------------------------------------------------------------------- #
 
 
-def test_add_nonexistent_product_to_cart(client: TestClient, user_token_headers: Dict):
+async def test_add_nonexistent_product_to_cart(add_item: Callable):
     """Testa adicionar um produto com ID inválido ao carrinho (espera 404)."""
     item_data = {"product_id": 9999, "quantity": 1}
-    response = client.post("/cart/items/", headers=user_token_headers, json=item_data)
+    response = await add_item(json=item_data)
     assert response.status_code == 404
     assert "Produto não encontrado" in response.json()["detail"]
 
 
-def test_update_item_not_in_cart(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_update_item_not_in_cart(
+    put_item: Callable, product_for_cart_tests: Dict
 ):
     """
     Testa a falha ao tentar atualizar a quantidade de um produto
     que não está no carrinho.
     """
     product_id = product_for_cart_tests["id"]
-    response = client.put(
-        f"/cart/items/{product_id}",
-        headers=user_token_headers,
-        json={"quantity": 2},
-    )
+    response = await put_item(product_id, 2)
     assert response.status_code == 404
     assert (
         "Item não encontrado no carrinho ou estoque insuficiente"
@@ -228,26 +249,23 @@ def test_update_item_not_in_cart(
     )
 
 
-def test_update_cart_item_to_zero_removes_item(
-    client: TestClient, user_token_headers: Dict, product_for_cart_tests: Dict
+async def test_update_cart_item_to_zero_removes_item(
+    add_item: Callable,
+    put_item: Callable,
+    get_cart: Callable,
+    product_for_cart_tests: Dict,
 ):
     """
     Testa se tentar atualizar um item com quantidade 0 o remove do carrinho.
     Este teste cobre as linhas 232-233 do CRUD.
     """
     product_id = product_for_cart_tests["id"]
-    client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": product_id, "quantity": 2},
-    ).raise_for_status()
+    (await add_item(json={"product_id": product_id, "quantity": 2})).raise_for_status()
 
-    update_response: Response = client.put(
-        f"/cart/items/{product_id}", headers=user_token_headers, json={"quantity": 0}
-    )
+    update_response = await put_item(product_id, 0)
     assert update_response.status_code == 204
 
-    cart_response = client.get("/cart/", headers=user_token_headers)
+    cart_response = await get_cart()
     assert not cart_response.json()["items"]
 
 
@@ -256,25 +274,28 @@ def test_update_cart_item_to_zero_removes_item(
 # -------------------------------------------------------------------------- #
 
 
-def test_superuser_cannot_delete_from_cart(
-    client: TestClient, superuser_token_headers: Dict
+async def test_superuser_cannot_delete_from_cart(
+    async_client: AsyncClient, superuser_token_headers: Dict
 ):
     """Testa se superusuário é proibido de usar a rota DELETE do carrinho."""
-    response = client.delete("/cart/items/1", headers=superuser_token_headers)
+    response = await async_client.delete(
+        "/cart/items/1", headers=superuser_token_headers
+    )
     assert response.status_code == 403, response.text
 
 
-def test_manipulate_cart_when_cart_is_missing(
-    client: TestClient,
+async def test_manipulate_cart_when_cart_is_missing(
+    async_client: AsyncClient,
     db_session: Session,
     test_user_payload: Dict,
     superuser_token_headers: Dict,
+    auth_headers_for: Callable[[str], Mapping[str, str]],
 ):
     """
     Testa que todas as rotas de manipulação de itens falham corretamente se
     um usuário, por algum motivo, não tiver um carrinho associado.
     """
-    cat_resp = client.post(
+    cat_resp = await async_client.post(
         "/categories/", headers=superuser_token_headers, json={"title": "Cat"}
     )
     cat_resp.raise_for_status()
@@ -288,7 +309,7 @@ def test_manipulate_cart_when_cart_is_missing(
         "width_cm": 1,
         "length_cm": 1,
     }
-    prod_resp = client.post(
+    prod_resp = await async_client.post(
         "/products/", headers=superuser_token_headers, json=prod_data
     )
     prod_resp.raise_for_status()
@@ -300,33 +321,32 @@ def test_manipulate_cart_when_cart_is_missing(
     db_session.delete(cart_to_delete)
     db_session.commit()
 
-    user_token = create_access_token(data={"sub": user.email})
-    headers = {"Authorization": f"Bearer {user_token}"}
+    headers = auth_headers_for(user.email)
 
-    add_response = client.post(
+    add_response = await async_client.post(
         "/cart/items/", headers=headers, json={"product_id": product_id, "quantity": 1}
     )
     assert add_response.status_code == 404
     assert "Carrinho do usuário não encontrado" in add_response.json()["detail"]
 
-    update_response = client.put(
+    update_response = await async_client.put(
         f"/cart/items/{product_id}", headers=headers, json={"quantity": 2}
     )
     assert update_response.status_code == 404
     assert "Carrinho do usuário não encontrado" in update_response.json()["detail"]
 
-    delete_response = client.delete(f"/cart/items/{product_id}", headers=headers)
+    delete_response = await async_client.delete(
+        f"/cart/items/{product_id}", headers=headers
+    )
     assert delete_response.status_code == 404
     assert "Carrinho do usuário não encontrado" in delete_response.json()["detail"]
 
 
-def test_remove_nonexistent_product_from_cart(
-    client: TestClient, user_token_headers: Dict
-):
+async def test_remove_nonexistent_product_from_cart(del_item: Callable):
     """
     Testa a falha ao tentar remover um produto que não está no carrinho.
     Cobre a linha 154.
     """
-    response = client.delete("/cart/items/9999", headers=user_token_headers)
+    response = await del_item(9999)
     assert response.status_code == 404
     assert "Produto não encontrado no carrinho" in response.json()["detail"]
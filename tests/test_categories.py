@@ -5,8 +5,8 @@ Testa todos os endpoints sob o prefixo '/categories', garantindo que:
 - O acesso público para leitura de categorias funciona como esperado.
 - As permissões para operações de escrita (criar, atualizar, deletar) estão
   corretamente aplicadas, permitindo apenas superusuários.
-- O ciclo completo de CRUD (Create, Read, Update, Delete) de uma categoria
-  pode ser executado por um superusuário.
+- Cada etapa do ciclo de CRUD (Create, Read, Update, Delete) de uma
+  categoria pode ser executada por um superusuário, em testes independentes.
 - Casos de borda, como solicitar uma categoria inexistente, retornam os
   erros HTTP apropriados.
 """
@@ -15,32 +15,37 @@ Testa todos os endpoints sob o prefixo '/categories', garantindo que:
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from fastapi.testclient import TestClient
 from typing import Dict
 
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from src import crud, schemas
+
 # -------------------------------------------------------------------------- #
 #                             TESTES DE ACESSO PÚBLICO                       #
 # -------------------------------------------------------------------------- #
 
 
-def test_read_categories_publicly_on_clean_db(client: TestClient):
+async def test_read_categories_publicly_on_clean_db(async_client: AsyncClient):
     """Testa se GET /categories/ em um BD limpo retorna uma lista vazia."""
-    response = client.get("/categories/")
+    response = await async_client.get("/categories/")
     assert response.status_code == 200
     assert response.json() == []
 
 
-def test_read_single_category_not_found(client: TestClient):
+async def test_read_single_category_not_found(async_client: AsyncClient):
     """Testa GET /categories/{id} com um ID inexistente, esperando 404."""
-    response = client.get("/categories/999")
+    response = await async_client.get("/categories/999")
     assert response.status_code == 404
     assert response.json()["detail"] == "Categoria não encontrada."
 
 
-def test_create_category_unauthorized(client: TestClient):
+async def test_create_category_unauthorized(async_client: AsyncClient):
     """Testa se POST /categories/ é bloqueado para clientes não autenticados."""
     category_data = {"title": "Proibido", "description": "Não será criado"}
-    response = client.post("/categories/", json=category_data)
+    response = await async_client.post("/categories/", json=category_data)
     assert response.status_code == 401
 
 
@@ -49,12 +54,12 @@ def test_create_category_unauthorized(client: TestClient):
 # -------------------------------------------------------------------------- #
 
 
-def test_create_category_as_common_user_is_forbidden(
-    client: TestClient, user_token_headers: Dict
+async def test_create_category_as_common_user_is_forbidden(
+    async_client: AsyncClient, user_token_headers: Dict
 ):
     """Testa se um usuário comum não pode criar uma categoria (espera 403)."""
     category_data = {"title": "Falha", "description": "Criado por usuário comum"}
-    response = client.post(
+    response = await async_client.post(
         "/categories/", headers=user_token_headers, json=category_data
     )
     assert response.status_code == 403, response.text
@@ -66,48 +71,73 @@ def test_create_category_as_common_user_is_forbidden(
 # -------------------------------------------------------------------------- #
 
 
-def test_superuser_crud_cycle(client: TestClient, superuser_token_headers: Dict):
-    """
-    Testa o ciclo de vida completo de uma categoria (CRUD) por um superuser.
-    1. Criação
-    2. Leitura
-    3. Atualização
-    4. Deleção
-    5. Confirmação da Deleção
-    """
+@pytest.fixture
+def existing_category(db_session: Session) -> Dict:
+    """Cria, via camada CRUD, a categoria usada pelas etapas do ciclo de CRUD."""
+    category = crud.create_category(
+        db_session,
+        schemas.CategoryCreate(title="Eletrônicos", description="Dispositivos"),
+    )
+    return {"id": category.id, "title": category.title}
+
+
+async def test_superuser_can_create_category(
+    async_client: AsyncClient, superuser_token_headers: Dict
+):
+    """Testa a criação de uma categoria por um superusuário (etapa 'Create')."""
     create_data = {"title": "Eletrônicos", "description": "Dispositivos"}
-    create_response = client.post(
+    response = await async_client.post(
         "/categories/", headers=superuser_token_headers, json=create_data
     )
-    assert create_response.status_code == 201
-    category = create_response.json()
-    category_id = category["id"]
+    assert response.status_code == 201
+    assert response.json()["title"] == create_data["title"]
+
+
+async def test_read_existing_category(
+    async_client: AsyncClient, existing_category: Dict
+):
+    """Testa a leitura pública de uma categoria existente (etapa 'Read')."""
+    response = await async_client.get(f"/categories/{existing_category['id']}")
+    assert response.status_code == 200
+    assert response.json()["title"] == existing_category["title"]
 
-    get_response = client.get(f"/categories/{category_id}")
-    assert get_response.status_code == 200
-    assert get_response.json()["title"] == create_data["title"]
 
+async def test_superuser_can_update_category(
+    async_client: AsyncClient, superuser_token_headers: Dict, existing_category: Dict
+):
+    """Testa a atualização de uma categoria por um superusuário (etapa 'Update')."""
     update_data = {"title": "Eletrônicos e Gadgets", "description": "Atualizado"}
-    update_response = client.put(
-        f"/categories/{category_id}", headers=superuser_token_headers, json=update_data
+    response = await async_client.put(
+        f"/categories/{existing_category['id']}",
+        headers=superuser_token_headers,
+        json=update_data,
     )
-    assert update_response.status_code == 200
-    assert update_response.json()["title"] == update_data["title"]
+    assert response.status_code == 200
+    assert response.json()["title"] == update_data["title"]
 
-    delete_response = client.delete(
+
+async def test_superuser_can_delete_category(
+    async_client: AsyncClient, superuser_token_headers: Dict, existing_category: Dict
+):
+    """
+    Testa a deleção de uma categoria por um superusuário e confirma que ela
+    deixa de existir (etapa 'Delete').
+    """
+    category_id = existing_category["id"]
+    delete_response = await async_client.delete(
         f"/categories/{category_id}", headers=superuser_token_headers
     )
     assert delete_response.status_code == 200
 
-    confirm_get_response = client.get(f"/categories/{category_id}")
+    confirm_get_response = await async_client.get(f"/categories/{category_id}")
     assert confirm_get_response.status_code == 404
 
 
-def test_superuser_update_nonexistent_category(
-    client: TestClient, superuser_token_headers: Dict
+async def test_superuser_update_nonexistent_category(
+    async_client: AsyncClient, superuser_token_headers: Dict
 ):
     """Testa a atualização de uma categoria com ID inexistente (espera 404)."""
-    response = client.put(
+    response = await async_client.put(
         "/categories/999",
         headers=superuser_token_headers,
         json={"title": "Fantasma"},
@@ -115,9 +145,11 @@ def test_superuser_update_nonexistent_category(
     assert response.status_code == 404
 
 
-def test_superuser_delete_nonexistent_category(
-    client: TestClient, superuser_token_headers: Dict
+async def test_superuser_delete_nonexistent_category(
+    async_client: AsyncClient, superuser_token_headers: Dict
 ):
     """Testa a deleção de uma categoria com ID inexistente (espera 404)."""
-    response = client.delete("/categories/999", headers=superuser_token_headers)
+    response = await async_client.delete(
+        "/categories/999", headers=superuser_token_headers
+    )
     assert response.status_code == 404
@@ -181,5 +181,6 @@ def test_order_creation_with_coupon(
     assert order_json["coupon_code_used"] == "PEDIDO20"
 
     cart_resp = client.get("/cart/", headers=user_token_headers)
-    assert not cart_resp.json()["items"]
-    assert cart_resp.json()["coupon"] is None
+    cart_json = cart_resp.json()
+    assert not cart_json["items"]
+    assert cart_json["coupon"] is None
@@ -12,10 +12,10 @@ como esperado fora do ambiente de teste com 'overrides'.
 import pytest
 from fastapi import FastAPI, Depends
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session
 
-from src.database import get_db, Base
-from conftest import engine as test_engine
+from src.database import get_db
 
 # -------------------------------------------------------------------------- #
 #                       SETUP DA APLICAÇÃO E ENDPOINT DE TESTE               #
@@ -39,7 +39,9 @@ def db_dependency_test_endpoint(db: Session = Depends(get_db)):
 # -------------------------------------------------------------------------- #
 
 
-def test_get_db_dependency_lifecycle(monkeypatch: pytest.MonkeyPatch):
+def test_get_db_dependency_lifecycle(
+    monkeypatch: pytest.MonkeyPatch, test_engine: Engine
+):
     """
     Testa se a dependência `get_db` original cria, fornece e fecha uma sessão.
 
@@ -53,11 +55,7 @@ def test_get_db_dependency_lifecycle(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr("src.database.engine", test_engine)
     monkeypatch.setattr("src.database.SessionLocal.kw", {"bind": test_engine})
 
-    Base.metadata.create_all(bind=test_engine)
-
     with TestClient(app_for_db_test) as client:
         response = client.get("/test-db")
         assert response.status_code == 200
         assert response.json() == {"status": "success"}
-
-    Base.metadata.drop_all(bind=test_engine)
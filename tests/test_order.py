@@ -16,42 +16,68 @@ completo de um pedido. Foco principal em validar a lógica de negócio crítica:
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Mapping
 
-from fastapi.testclient import TestClient
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from src import models, crud
-from src.auth import create_access_token
+from src import models, crud, schemas
 from src.schemas import UserCreate
 
+USER_B_PAYLOAD = {
+    "email": "user.b@test.com",
+    "password": "passwordB",
+    "full_name": "User B",
+    "cpf": "93963227095",
+    "phone": "(33)77777-7777",
+    "address_street": "Rua B",
+    "address_number": "3",
+    "address_zip": "67890-000",
+    "address_city": "Cidade B",
+    "address_state": "AC",
+}
+
 # -------------------------------------------------------------------------- #
-#                         FUNÇÃO AUXILIAR DE SETUP                           #
+#                        FIXTURE AUXILIAR DE SETUP                           #
 # -------------------------------------------------------------------------- #
 
 
-def create_product_for_order(
-    client: TestClient, headers: Dict[str, str], sku: str
-) -> Dict[str, Any]:
-    """Cria uma categoria e um produto com estoque para ser usado nos testes."""
-    cat_resp = client.post(
-        "/categories/", headers=headers, json={"title": f"Cat-{sku}"}
+@pytest.fixture
+def product_for_order(db_session: Session) -> Dict[str, Any]:
+    """
+    Fixture que cria uma categoria e um produto com estoque para os testes.
+
+    Ambos são inseridos diretamente pelo ORM em uma única transação; apenas
+    as etapas de carrinho e de pedido passam pela API em cada teste.
+    """
+    product = models.Product(
+        sku="PROD-ORD-001",
+        name="Item PROD-ORD-001",
+        price=25.50,
+        category=models.Category(title="Cat-PROD-ORD-001"),
+        stock=10,
+        weight_kg=0.3,
+        height_cm=4,
+        width_cm=12,
+        length_cm=18,
     )
-    cat_resp.raise_for_status()
-    prod_data = {
-        "sku": sku,
-        "name": f"Item {sku}",
-        "price": 25.50,
-        "category_id": cat_resp.json()["id"],
-        "stock": 10,
-        "weight_kg": 0.3,
-        "height_cm": 4,
-        "width_cm": 12,
-        "length_cm": 18,
-    }
-    prod_resp = client.post("/products/", headers=headers, json=prod_data)
-    prod_resp.raise_for_status()
-    return prod_resp.json()
+    db_session.add(product)
+    db_session.commit()
+    return schemas.Product.model_validate(product).model_dump(mode="json")
+
+
+@pytest.fixture
+def user_b_headers(
+    db_session: Session, auth_headers_for: Callable[[str], Mapping[str, str]]
+) -> Mapping[str, str]:
+    """
+    Fixture que cria um segundo usuário comum ("User B") e retorna seus
+    cabeçalhos de autenticação, vindos do cache de `auth_headers_for`.
+    """
+    crud.create_user(db_session, user=UserCreate(**USER_B_PAYLOAD))
+    return auth_headers_for(USER_B_PAYLOAD["email"])
 
 
 # -------------------------------------------------------------------------- #
@@ -59,26 +85,26 @@ def create_product_for_order(
 # -------------------------------------------------------------------------- #
 
 
-def test_create_order_from_empty_cart_fails(
-    client: TestClient, user_token_headers: Dict
+async def test_create_order_from_empty_cart_fails(
+    async_client: AsyncClient, user_token_headers: Dict
 ):
     """Testa a falha de criação de um pedido com um carrinho vazio (espera 400)."""
-    response = client.post("/orders/", headers=user_token_headers)
+    response = await async_client.post("/orders/", headers=user_token_headers)
     assert response.status_code == 400, response.text
     assert "Carrinho vazio" in response.json()["detail"]
 
 
-def test_superuser_cannot_create_order(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_superuser_cannot_create_order(
+    async_client: AsyncClient, superuser_token_headers: Dict[str, str]
 ):
     """Testa que superusuários não podem criar pedidos (espera 403)."""
-    response = client.post("/orders/", headers=superuser_token_headers)
+    response = await async_client.post("/orders/", headers=superuser_token_headers)
     assert response.status_code == 403, response.text
 
 
-def test_create_order_unauthorized(client: TestClient):
+async def test_create_order_unauthorized(async_client: AsyncClient):
     """Testa que clientes não autenticados não podem criar pedidos (espera 401)."""
-    response = client.post("/orders/")
+    response = await async_client.post("/orders/")
     assert response.status_code == 401, response.text
 
 
@@ -87,100 +113,94 @@ def test_create_order_unauthorized(client: TestClient):
 # -------------------------------------------------------------------------- #
 
 
-def test_order_creation_success_and_stock_deduction(
-    client: TestClient,
+async def test_order_creation_success_and_stock_deduction(
+    async_client: AsyncClient,
     user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
+    product_for_order: Dict[str, Any],
     db_session: Session,
 ):
     """
     Testa o fluxo de ponta-a-ponta: popular carrinho -> criar pedido ->
     verificar débito do estoque -> verificar carrinho vazio.
     """
-    product = create_product_for_order(client, superuser_token_headers, "PROD-ORD-001")
+    product = product_for_order
     product_id = product["id"]
     initial_stock = product["stock"]
     quantity_to_buy = 2
 
-    client.post(
+    cart_resp = await async_client.post(
         "/cart/items/",
         headers=user_token_headers,
         json={"product_id": product_id, "quantity": quantity_to_buy},
-    ).raise_for_status()
+    )
+    cart_resp.raise_for_status()
 
-    order_response = client.post("/orders/", headers=user_token_headers)
+    order_response = await async_client.post("/orders/", headers=user_token_headers)
     assert order_response.status_code == 201, order_response.text
 
     product_in_db = db_session.get(models.Product, product_id)
     assert product_in_db is not None, "Produto deveria ser encontrado no DB"
     assert product_in_db.stock == initial_stock - quantity_to_buy
 
-    cart_response = client.get("/cart/", headers=user_token_headers)
-    assert not cart_response.json()["items"]
+    order_json = order_response.json()
+    assert order_json["items"][0]["quantity"] == quantity_to_buy
+    assert order_json["total_price"] == pytest.approx(
+        product["price"] * quantity_to_buy
+    )
+
+    assert db_session.scalar(select(func.count()).select_from(models.CartItem)) == 0
 
 
-def test_order_creation_fails_if_stock_is_insufficient_at_checkout(
-    client: TestClient,
+async def test_order_creation_fails_if_stock_is_insufficient_at_checkout(
+    async_client: AsyncClient,
     user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
+    product_for_order: Dict[str, Any],
     db_session: Session,
 ):
     """
     Testa o cenário de concorrência: um item está no carrinho, mas seu
     estoque é reduzido por outra via antes da finalização da compra.
     """
-    product = create_product_for_order(client, superuser_token_headers, "PROD-ORD-002")
+    product = product_for_order
     product_id = product["id"]
 
-    client.post(
+    cart_resp = await async_client.post(
         "/cart/items/",
         headers=user_token_headers,
         json={"product_id": product_id, "quantity": 5},
-    ).raise_for_status()
+    )
+    cart_resp.raise_for_status()
 
     product_in_db = db_session.get(models.Product, product_id)
     assert product_in_db is not None, "Produto deveria ser encontrado no DB"
     product_in_db.stock = 3
     db_session.commit()
 
-    order_response = client.post("/orders/", headers=user_token_headers)
+    order_response = await async_client.post("/orders/", headers=user_token_headers)
     assert order_response.status_code == 400, order_response.text
     assert "Estoque insuficiente" in order_response.json()["detail"]
 
 
-def test_user_cannot_see_another_users_order(
-    client: TestClient,
+async def test_user_cannot_see_another_users_order(
+    async_client: AsyncClient,
     user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
-    db_session: Session,
+    user_b_headers: Mapping[str, str],
+    product_for_order: Dict[str, Any],
 ):
     """Testa se um usuário comum não pode visualizar o pedido de outro usuário."""
-    user_b_payload = {
-        "email": "user.b@test.com",
-        "password": "passwordB",
-        "full_name": "User B",
-        "cpf": "93963227095",
-        "phone": "(33)77777-7777",
-        "address_street": "Rua B",
-        "address_number": "3",
-        "address_zip": "67890-000",
-        "address_city": "Cidade B",
-        "address_state": "AC",
-    }
-    crud.create_user(db_session, user=UserCreate(**user_b_payload))
-    user_b_token = create_access_token(data={"sub": user_b_payload["email"]})
-    user_b_headers = {"Authorization": f"Bearer {user_b_token}"}
-
-    product = create_product_for_order(client, superuser_token_headers, "PROD-ORD-B")
-    client.post(
+    product = product_for_order
+    cart_resp = await async_client.post(
         "/cart/items/",
         headers=user_b_headers,
         json={"product_id": product["id"], "quantity": 1},
-    ).raise_for_status()
-    order_b_response = client.post("/orders/", headers=user_b_headers)
+    )
+    cart_resp.raise_for_status()
+    order_b_response = await async_client.post("/orders/", headers=user_b_headers)
     order_b_id = order_b_response.json()["id"]
 
-    response = client.get(f"/orders/{order_b_id}", headers=user_token_headers)
+    response = await async_client.get(
+        f"/orders/{order_b_id}", headers=user_token_headers
+    )
     assert response.status_code == 403, response.text
     assert "Não autorizado a visualizar este pedido" in response.json()["detail"]
 
@@ -190,39 +210,40 @@ def test_user_cannot_see_another_users_order(
 # -------------------------------------------------------------------------- #
 
 
-def test_order_creation_handles_unexpected_db_error(
-    client: TestClient,
+async def test_order_creation_handles_unexpected_db_error(
+    async_client: AsyncClient,
     user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
+    product_for_order: Dict[str, Any],
     mocker,
 ):
     """
     Testa se um erro inesperado do banco de dados durante a criação do pedido
     é tratado corretamente, retornando um status 500.
     """
-    product = create_product_for_order(client, superuser_token_headers, "PROD-ERR-01")
-    client.post(
+    product = product_for_order
+    cart_resp = await async_client.post(
         "/cart/items/",
         headers=user_token_headers,
         json={"product_id": product["id"], "quantity": 1},
-    ).raise_for_status()
+    )
+    cart_resp.raise_for_status()
 
     mocker.patch(
         "sqlalchemy.orm.Session.commit",
         side_effect=Exception("Simulated unexpected database error"),
     )
 
-    response = client.post("/orders/", headers=user_token_headers)
+    response = await async_client.post("/orders/", headers=user_token_headers)
 
     assert response.status_code == 500, response.text
     assert "Ocorreu um erro inesperado" in response.json()["detail"]
 
 
-def test_read_single_nonexistent_order(
-    client: TestClient, user_token_headers: Dict[str, str]
+async def test_read_single_nonexistent_order(
+    async_client: AsyncClient, user_token_headers: Dict[str, str]
 ):
     """Testa a busca por um pedido com um ID que não existe (espera 404)."""
-    response = client.get("/orders/9999", headers=user_token_headers)
+    response = await async_client.get("/orders/9999", headers=user_token_headers)
     assert response.status_code == 404
 
 
@@ -231,42 +252,73 @@ def test_read_single_nonexistent_order(
 # -------------------------------------------------------------------------- #
 
 
-def test_order_creation_fails_if_product_is_deleted(
-    client: TestClient,
+async def test_order_creation_fails_if_product_is_deleted(
+    async_client: AsyncClient,
     user_token_headers: Dict[str, str],
-    superuser_token_headers: Dict[str, str],
+    product_for_order: Dict[str, Any],
     db_session: Session,
 ):
     """
     Testa a falha na criação de um pedido se um produto no carrinho
     foi deletado antes da finalização.
     """
-    product = create_product_for_order(client, superuser_token_headers, "PROD-DEL-01")
+    product = product_for_order
     product_id = product["id"]
 
-    client.post(
+    cart_resp = await async_client.post(
         "/cart/items/",
         headers=user_token_headers,
         json={"product_id": product_id, "quantity": 1},
-    ).raise_for_status()
+    )
+    cart_resp.raise_for_status()
 
     db_product = db_session.get(models.Product, product_id)
     assert db_product is not None
     db_session.delete(db_product)
     db_session.commit()
 
-    response = client.post("/orders/", headers=user_token_headers)
+    response = await async_client.post("/orders/", headers=user_token_headers)
     assert response.status_code == 400, response.text
     assert "não existe mais" in response.json()["detail"]
 
 
-def test_read_my_orders_returns_list(
-    client: TestClient, user_token_headers: Dict[str, str]
+async def test_read_my_orders_returns_list(
+    async_client: AsyncClient, user_token_headers: Dict[str, str]
 ):
     """
     Testa se a rota para ler os próprios pedidos retorna uma lista, cobrindo a
-    função CRUD subjacente.
+    função CRUD subjacente (via cliente assíncrono).
     """
-    response = client.get("/orders/", headers=user_token_headers)
+    response = await async_client.get("/orders/", headers=user_token_headers)
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+async def test_read_my_orders_streams_every_order(
+    async_client: AsyncClient,
+    user_token_headers: Dict[str, str],
+    product_for_order: Dict[str, Any],
+):
+    """
+    Testa se a listagem em streaming gera um array JSON válido contendo todos
+    os pedidos do usuário, cada um com seus itens.
+    """
+    product = product_for_order
+    created_ids = []
+    for _ in range(3):
+        cart_resp = await async_client.post(
+            "/cart/items/",
+            headers=user_token_headers,
+            json={"product_id": product["id"], "quantity": 1},
+        )
+        cart_resp.raise_for_status()
+        order_response = await async_client.post("/orders/", headers=user_token_headers)
+        assert order_response.status_code == 201, order_response.text
+        created_ids.append(order_response.json()["id"])
+
+    response = await async_client.get("/orders/", headers=user_token_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    orders = response.json()
+    assert sorted(order["id"] for order in orders) == sorted(created_ids)
+    assert all(order["items"][0]["product"]["id"] == product["id"] for order in orders)
@@ -9,15 +9,17 @@ de sessão de checkout e o processamento de webhooks do Stripe.
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from fastapi.testclient import TestClient
 import pytest
-from typing import Dict
-from unittest.mock import MagicMock
+from typing import Any, Dict, Iterator, Optional
+from unittest.mock import MagicMock, patch
 
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
 import stripe
+from stripe import SignatureVerificationError
 
-from src.models import Order
+from src import schemas
+from src.models import Category, Order, OrderItem, Product
 
 # -------------------------------------------------------------------------- #
 #                        SETUP E FIXTURES AUXILIARES                         #
@@ -25,40 +27,60 @@ from src.models import Order
 
 
 @pytest.fixture(scope="function")
-def order_for_payment(
-    client: TestClient, user_token_headers: Dict, superuser_token_headers: Dict
-) -> Dict:
-    """Fixture que cria um cenário completo para o pagamento."""
-    cat_resp = client.post(
-        "/categories/", headers=superuser_token_headers, json={"title": "Pagamentos"}
+def order_for_payment(db_session: Session, test_user: Dict) -> Dict:
+    """
+    Fixture que cria um cenário completo para o pagamento: um pedido pendente
+    do usuário comum com uma unidade de um produto de R$ 123,45.
+
+    Categoria, produto, pedido e item são inseridos diretamente pelo ORM, com
+    um único `commit`; o fluxo carrinho -> pedido já é testado em
+    `test_order.py`.
+    """
+    product = Product(
+        sku="PAG-001",
+        name="Produto para Pagar",
+        price=123.45,
+        stock=10,
+        category=Category(title="Pagamentos"),
+        weight_kg=0.8,
+        height_cm=10,
+        width_cm=15,
+        length_cm=25,
     )
-    cat_resp.raise_for_status()
-
-    prod_data = {
-        "sku": "PAG-001",
-        "name": "Produto para Pagar",
-        "price": 123.45,
-        "stock": 10,
-        "category_id": cat_resp.json()["id"],
-        "weight_kg": 0.8,
-        "height_cm": 10,
-        "width_cm": 15,
-        "length_cm": 25,
-    }
-    prod_resp = client.post(
-        "/products/", headers=superuser_token_headers, json=prod_data
+    order = Order(
+        user_id=test_user["id"],
+        total_price=product.price,
+        discount_amount=0.0,
+        status="pending_payment",
+        items=[OrderItem(product=product, quantity=1, price_at_purchase=product.price)],
     )
-    prod_resp.raise_for_status()
-
-    client.post(
-        "/cart/items/",
-        headers=user_token_headers,
-        json={"product_id": prod_resp.json()["id"], "quantity": 1},
-    ).raise_for_status()
-
-    order_response = client.post("/orders/", headers=user_token_headers)
-    assert order_response.status_code == 201
-    return order_response.json()
+    db_session.add(order)
+    db_session.commit()
+    return schemas.Order.model_validate(order).model_dump(mode="json")
+
+
+@pytest.fixture
+def construct_event() -> Iterator[MagicMock]:
+    """
+    Fixture que substitui `stripe.Webhook.construct_event` por um mock.
+    Cada teste de webhook define o evento (`return_value`) ou a falha
+    (`side_effect`) que a verificação de assinatura deve produzir.
+    """
+    with patch("stripe.Webhook.construct_event") as mock_construct_event:
+        yield mock_construct_event
+
+
+def _checkout_completed_event(order_id: Optional[int] = None, **session: Any) -> Dict:
+    """
+    Monta o evento `checkout.session.completed` devolvido pelo mock de
+    `construct_event`. Sem `order_id`, os metadados vêm vazios; campos extras
+    da sessão do Stripe (ex: `payment_intent`) são passados como kwargs.
+    """
+    metadata = {} if order_id is None else {"order_id": str(order_id)}
+    return {
+        "type": "checkout.session.completed",
+        "data": {"object": {"metadata": metadata, **session}},
+    }
 
 
 # -------------------------------------------------------------------------- #
@@ -66,8 +88,8 @@ def order_for_payment(
 # -------------------------------------------------------------------------- #
 
 
-def test_create_checkout_session_success(
-    client: TestClient, order_for_payment: Dict, mocker
+async def test_create_checkout_session_success(
+    async_client: AsyncClient, order_for_payment: Dict
 ):
     """Testa o caminho feliz da criação de uma sessão de checkout."""
     order_id = order_for_payment["id"]
@@ -75,50 +97,68 @@ def test_create_checkout_session_success(
         url="https://checkout.stripe.com/pay/cs_test_12345",
         payment_intent="pi_test_12345",
     )
-    mocker.patch("stripe.checkout.Session.create", return_value=mock_stripe_session)
-    response = client.post(f"/payments/create-checkout-session/{order_id}")
+    with patch(
+        "stripe.checkout.Session.create", return_value=mock_stripe_session
+    ) as mock_create:
+        response = await async_client.post(
+            f"/payments/create-checkout-session/{order_id}"
+        )
     assert response.status_code == 200
     assert response.json() == {"checkout_url": mock_stripe_session.url}
-
-
-def test_create_checkout_for_nonexistent_order(client: TestClient):
-    response = client.post("/payments/create-checkout-session/9999")
+    assert mock_create.call_args.kwargs["line_items"] == [
+        {
+            "price_data": {
+                "currency": "brl",
+                "product_data": {"name": "Produto para Pagar"},
+                "unit_amount": 12345,
+            },
+            "quantity": 1,
+        }
+    ]
+
+
+async def test_create_checkout_for_nonexistent_order(async_client: AsyncClient):
+    response = await async_client.post("/payments/create-checkout-session/9999")
     assert response.status_code == 404
 
 
-def test_create_checkout_for_paid_order(
-    client: TestClient, order_for_payment: Dict, db_session: Session
+async def test_create_checkout_for_paid_order(
+    async_client: AsyncClient, order_for_payment: Dict, db_session: Session
 ):
     order_id = order_for_payment["id"]
     order_in_db = db_session.get(Order, order_id)
     assert order_in_db is not None
     order_in_db.status = "paid"
     db_session.commit()
-    response = client.post(f"/payments/create-checkout-session/{order_id}")
+    response = await async_client.post(f"/payments/create-checkout-session/{order_id}")
     assert response.status_code == 400
 
 
-def test_create_checkout_session_handles_stripe_error(
-    client: TestClient, order_for_payment: Dict, mocker
+async def test_create_checkout_session_handles_stripe_error(
+    async_client: AsyncClient, order_for_payment: Dict
 ):
     order_id = order_for_payment["id"]
-    mocker.patch(
+    with patch(
         "stripe.checkout.Session.create", side_effect=stripe.StripeError("API Error")
-    )
-    response = client.post(f"/payments/create-checkout-session/{order_id}")
+    ):
+        response = await async_client.post(
+            f"/payments/create-checkout-session/{order_id}"
+        )
     assert response.status_code == 400
     assert "Stripe error" in response.json()["detail"]
 
 
-def test_create_checkout_session_handles_missing_url(
-    client: TestClient, order_for_payment: Dict, mocker
+async def test_create_checkout_session_handles_missing_url(
+    async_client: AsyncClient, order_for_payment: Dict
 ):
     order_id = order_for_payment["id"]
-    mocker.patch(
+    with patch(
         "stripe.checkout.Session.create",
         return_value=MagicMock(url=None, payment_intent="pi_test"),
-    )
-    response = client.post(f"/payments/create-checkout-session/{order_id}")
+    ):
+        response = await async_client.post(
+            f"/payments/create-checkout-session/{order_id}"
+        )
     assert response.status_code == 500
     assert "did not return a checkout URL" in response.json()["detail"]
 
@@ -128,23 +168,19 @@ def test_create_checkout_session_handles_missing_url(
 # -------------------------------------------------------------------------- #
 
 
-def test_stripe_webhook_success_payment(
-    client: TestClient, order_for_payment: Dict, db_session: Session, mocker
+async def test_stripe_webhook_success_payment(
+    async_client: AsyncClient,
+    order_for_payment: Dict,
+    db_session: Session,
+    construct_event: MagicMock,
 ):
     """Testa o processamento bem-sucedido de um webhook de pagamento."""
     order_id = order_for_payment["id"]
-    event_payload = {
-        "type": "checkout.session.completed",
-        "data": {
-            "object": {
-                "metadata": {"order_id": str(order_id)},
-                "payment_intent": "pi_test_123",
-                "payment_status": "paid",
-            }
-        },
-    }
-    mocker.patch("stripe.Webhook.construct_event", return_value=event_payload)
-    response = client.post(
+    event_payload = _checkout_completed_event(
+        order_id, payment_intent="pi_test_123", payment_status="paid"
+    )
+    construct_event.return_value = event_payload
+    response = await async_client.post(
         "/payments/webhook",
         json=event_payload,
         headers={"Stripe-Signature": "dummy_sig"},
@@ -156,27 +192,24 @@ def test_stripe_webhook_success_payment(
     assert order_in_db.payment_intent_id == "pi_test_123"
 
 
-def test_stripe_webhook_invalid_signature(client: TestClient, mocker):
+async def test_stripe_webhook_invalid_signature(
+    async_client: AsyncClient, construct_event: MagicMock
+):
     """Testa a falha do webhook quando a assinatura do Stripe é inválida."""
-    from stripe import SignatureVerificationError
-
-    mocker.patch(
-        "stripe.Webhook.construct_event",
-        side_effect=SignatureVerificationError("Invalid sig", "sig"),
-    )
-    response = client.post(
+    construct_event.side_effect = SignatureVerificationError("Invalid sig", "sig")
+    response = await async_client.post(
         "/payments/webhook", json={}, headers={"Stripe-Signature": "invalid_sig"}
     )
     assert response.status_code == 400
     assert response.json()["detail"] == "Invalid webhook signature"
 
 
-def test_stripe_webhook_handles_value_error(client: TestClient, mocker):
+async def test_stripe_webhook_handles_value_error(
+    async_client: AsyncClient, construct_event: MagicMock
+):
     """Testa o tratamento de um payload inválido que causa ValueError."""
-    mocker.patch(
-        "stripe.Webhook.construct_event", side_effect=ValueError("Invalid payload")
-    )
-    response = client.post(
+    construct_event.side_effect = ValueError("Invalid payload")
+    response = await async_client.post(
         "/payments/webhook",
         content="not-a-valid-json",
         headers={"Stripe-Signature": "dummy_sig"},
@@ -185,14 +218,13 @@ def test_stripe_webhook_handles_value_error(client: TestClient, mocker):
     assert response.json()["detail"] == "Invalid webhook payload"
 
 
-def test_stripe_webhook_handles_missing_order_id(client: TestClient, mocker):
+async def test_stripe_webhook_handles_missing_order_id(
+    async_client: AsyncClient, construct_event: MagicMock
+):
     """Testa o webhook recebendo um evento completo, mas sem order_id."""
-    event_payload = {
-        "type": "checkout.session.completed",
-        "data": {"object": {"metadata": {}}},
-    }
-    mocker.patch("stripe.Webhook.construct_event", return_value=event_payload)
-    response = client.post(
+    event_payload = _checkout_completed_event()
+    construct_event.return_value = event_payload
+    response = await async_client.post(
         "/payments/webhook",
         json=event_payload,
         headers={"Stripe-Signature": "dummy_sig"},
@@ -201,11 +233,13 @@ def test_stripe_webhook_handles_missing_order_id(client: TestClient, mocker):
     assert response.json()["detail"] == "Webhook ignored, no order_id."
 
 
-def test_stripe_webhook_handles_unhandled_event_type(client: TestClient, mocker):
+async def test_stripe_webhook_handles_unhandled_event_type(
+    async_client: AsyncClient, construct_event: MagicMock
+):
     """Testa o caminho do 'else', recebendo um tipo de evento não tratado."""
     event_payload = {"type": "payment_intent.created"}
-    mocker.patch("stripe.Webhook.construct_event", return_value=event_payload)
-    response = client.post(
+    construct_event.return_value = event_payload
+    response = await async_client.post(
         "/payments/webhook",
         json=event_payload,
         headers={"Stripe-Signature": "dummy_sig"},
@@ -214,31 +248,25 @@ def test_stripe_webhook_handles_unhandled_event_type(client: TestClient, mocker)
     assert response.json() == {"status": "success"}
 
 
-def test_stripe_webhook_handles_db_update_failure(
-    client: TestClient, order_for_payment: Dict, db_session: Session, mocker
+async def test_stripe_webhook_handles_db_update_failure(
+    async_client: AsyncClient,
+    order_for_payment: Dict,
+    db_session: Session,
+    construct_event: MagicMock,
 ):
     """Testa o tratamento de uma falha de banco de dados durante o processamento do webhook."""
     order_id = order_for_payment["id"]
-    event_payload = {
-        "type": "checkout.session.completed",
-        "data": {
-            "object": {
-                "metadata": {"order_id": str(order_id)},
-                "payment_status": "paid",
-            }
-        },
-    }
-    mocker.patch("stripe.Webhook.construct_event", return_value=event_payload)
+    event_payload = _checkout_completed_event(order_id, payment_status="paid")
+    construct_event.return_value = event_payload
 
-    mocker.patch(
+    with patch(
         "sqlalchemy.orm.Session.commit", side_effect=Exception("DB commit failed")
-    )
-
-    response = client.post(
-        "/payments/webhook",
-        json=event_payload,
-        headers={"Stripe-Signature": "dummy_sig"},
-    )
+    ):
+        response = await async_client.post(
+            "/payments/webhook",
+            json=event_payload,
+            headers={"Stripe-Signature": "dummy_sig"},
+        )
 
     assert response.status_code == 500
     assert (
@@ -14,21 +14,38 @@ Testa todos os endpoints sob o prefixo '/products', cobrindo:
 #                             IMPORTS NECESSÁRIOS                            #
 # -------------------------------------------------------------------------- #
 
-from typing import Dict
+from typing import Callable, Dict, Optional
 
-from fastapi.testclient import TestClient
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from src import models
 
 # -------------------------------------------------------------------------- #
-#                        FUNÇÃO AUXILIAR DE SETUP                            #
+#                        FIXTURE AUXILIAR DE SETUP                           #
 # -------------------------------------------------------------------------- #
 
 
-def create_category_and_get_id(client: TestClient, headers: Dict, title: str) -> int:
-    """Função auxiliar para criar uma categoria de teste e retornar seu ID."""
-    category_data = {"title": title, "description": f"Categoria {title}"}
-    response = client.post("/categories/", headers=headers, json=category_data)
-    assert response.status_code == 201, response.text
-    return response.json()["id"]
+@pytest.fixture
+def category_factory(db_session: Session) -> Callable[[str], int]:
+    """
+    Fixture que cria categorias de teste pelo ORM e retorna seus IDs.
+
+    Os IDs são memorizados por título durante o teste, de modo que pedir a
+    mesma categoria duas vezes não gera um novo `INSERT`.
+    """
+    ids_by_title: Dict[str, int] = {}
+
+    def _make(title: str) -> int:
+        if title not in ids_by_title:
+            category = models.Category(title=title, description=f"Categoria {title}")
+            db_session.add(category)
+            db_session.commit()
+            ids_by_title[title] = category.id
+        return ids_by_title[title]
+
+    return _make
 
 
 # -------------------------------------------------------------------------- #
@@ -36,32 +53,25 @@ def create_category_and_get_id(client: TestClient, headers: Dict, title: str) ->
 # -------------------------------------------------------------------------- #
 
 
-def test_read_products_publicly(client: TestClient):
+async def test_read_products_publicly(async_client: AsyncClient):
     """Testa se GET /products/ é público e retorna uma lista vazia em um BD limpo."""
-    response = client.get("/products/")
+    response = await async_client.get("/products/")
     assert response.status_code == 200
     assert response.json() == []
 
 
-def test_read_single_product_not_found(client: TestClient):
-    """Testa a solicitação de um produto com um ID que não existe."""
-    response = client.get("/products/9999")
-    assert response.status_code == 404
-    assert "Produto não encontrado" in response.json()["detail"]
-
-
 # -------------------------------------------------------------------------- #
 #         TESTES DE CRUD COMPLETO E VALIDAÇÃO (COMO SUPERUSER)               #
 # -------------------------------------------------------------------------- #
 
 
-def test_superuser_product_crud_cycle(
-    client: TestClient, superuser_token_headers: Dict
+async def test_superuser_product_crud_cycle(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    category_factory: Callable[[str], int],
 ):
     """Testa o ciclo de vida completo (CRUD) de um produto por um superuser."""
-    category_id = create_category_and_get_id(
-        client, superuser_token_headers, "Eletronicos"
-    )
+    category_id = category_factory("Eletronicos")
 
     product_data = {
         "name": "Laptop Pro",
@@ -75,7 +85,7 @@ def test_superuser_product_crud_cycle(
         "width_cm": 35.0,
         "length_cm": 25.0,
     }
-    create_response = client.post(
+    create_response = await async_client.post(
         "/products/", headers=superuser_token_headers, json=product_data
     )
     assert create_response.status_code == 201, create_response.text
@@ -86,7 +96,7 @@ def test_superuser_product_crud_cycle(
     assert product["sku"] == product_data["sku"]
     assert product["stock"] == product_data["stock"]
 
-    read_response = client.get(f"/products/{product_id}")
+    read_response = await async_client.get(f"/products/{product_id}")
     assert read_response.status_code == 200
     assert read_response.json()["name"] == product_data["name"]
 
@@ -96,7 +106,7 @@ def test_superuser_product_crud_cycle(
         "stock": 5,
         "weight_kg": 1.7,
     }
-    update_response = client.put(
+    update_response = await async_client.put(
         f"/products/{product_id}", headers=superuser_token_headers, json=update_data
     )
     assert update_response.status_code == 200, update_response.text
@@ -106,12 +116,12 @@ def test_superuser_product_crud_cycle(
     assert updated_product["stock"] == update_data["stock"]
     assert updated_product["weight_kg"] == 1.7
 
-    delete_response = client.delete(
+    delete_response = await async_client.delete(
         f"/products/{product_id}", headers=superuser_token_headers
     )
     assert delete_response.status_code == 200
 
-    confirm_response = client.get(f"/products/{product_id}")
+    confirm_response = await async_client.get(f"/products/{product_id}")
     assert confirm_response.status_code == 404
 
 
@@ -120,24 +130,22 @@ def test_superuser_product_crud_cycle(
 # -------------------------------------------------------------------------- #
 
 
-def test_search_and_filter_products_functionality(
-    client: TestClient, superuser_token_headers: Dict
+async def test_search_and_filter_products_functionality(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    category_factory: Callable[[str], int],
 ):
     """
     Testa a funcionalidade de busca e filtro de produtos de forma abrangente.
     Cria produtos em diferentes categorias com nomes e descrições distintos
     para validar os vários cenários de busca.
     """
-    cat_a_id = create_category_and_get_id(
-        client, superuser_token_headers, title="Roupas"
-    )
-    cat_b_id = create_category_and_get_id(
-        client, superuser_token_headers, title="Calçados"
-    )
+    cat_a_id = category_factory("Roupas")
+    cat_b_id = category_factory("Calçados")
 
     base_logistics = {"weight_kg": 0.3, "height_cm": 5, "width_cm": 20, "length_cm": 30}
 
-    client.post(
+    prod_resp = await async_client.post(
         "/products/",
         headers=superuser_token_headers,
         json={
@@ -148,8 +156,9 @@ def test_search_and_filter_products_functionality(
             "description": "Tecido macio e confortável.",
             **base_logistics,
         },
-    ).raise_for_status()
-    client.post(
+    )
+    prod_resp.raise_for_status()
+    prod_resp = await async_client.post(
         "/products/",
         headers=superuser_token_headers,
         json={
@@ -161,8 +170,9 @@ def test_search_and_filter_products_functionality(
             **base_logistics,
             "weight_kg": 0.7,
         },
-    ).raise_for_status()
-    client.post(
+    )
+    prod_resp.raise_for_status()
+    prod_resp = await async_client.post(
         "/products/",
         headers=superuser_token_headers,
         json={
@@ -177,77 +187,79 @@ def test_search_and_filter_products_functionality(
             "width_cm": 15,
             "length_cm": 35,
         },
-    ).raise_for_status()
+    )
+    prod_resp.raise_for_status()
 
-    response = client.get("/products/?q=camisa de algodão")
+    response = await async_client.get("/products/?q=camisa de algodão")
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["sku"] == "CA-001"
+    products_json = response.json()
+    assert len(products_json) == 1
+    assert products_json[0]["sku"] == "CA-001"
 
-    response = client.get("/products/?q=Calça")
+    response = await async_client.get("/products/?q=Calça")
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["sku"] == "CJ-002"
+    products_json = response.json()
+    assert len(products_json) == 1
+    assert products_json[0]["sku"] == "CJ-002"
 
-    response = client.get("/products/?q=atletas")
+    response = await async_client.get("/products/?q=atletas")
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["sku"] == "TC-003"
+    products_json = response.json()
+    assert len(products_json) == 1
+    assert products_json[0]["sku"] == "TC-003"
 
-    response = client.get("/products/?q=jeans")
+    response = await async_client.get("/products/?q=jeans")
     assert response.status_code == 200
-    assert len(response.json()) == 2
-    skus_found = {p["sku"] for p in response.json()}
+    products_json = response.json()
+    assert len(products_json) == 2
+    skus_found = {p["sku"] for p in products_json}
     assert skus_found == {"CJ-002", "TC-003"}
 
-    response = client.get(f"/products/?q=jeans&category_id={cat_a_id}")
+    response = await async_client.get(f"/products/?q=jeans&category_id={cat_a_id}")
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["sku"] == "CJ-002"
+    products_json = response.json()
+    assert len(products_json) == 1
+    assert products_json[0]["sku"] == "CJ-002"
 
-    response = client.get("/products/?q=produto-fantasma-xyz")
+    response = await async_client.get("/products/?q=produto-fantasma-xyz")
     assert response.status_code == 200
     assert len(response.json()) == 0
 
 
-def test_read_products_filtered_by_category(
-    client: TestClient, superuser_token_headers: Dict
+async def test_read_products_filtered_by_category(
+    async_client: AsyncClient, db_session: Session
 ):
-    """Testa se a listagem de produtos com o filtro de categoria funciona."""
-    cat_a_id = create_category_and_get_id(
-        client, superuser_token_headers, title="Cat A"
-    )
-    cat_b_id = create_category_and_get_id(
-        client, superuser_token_headers, title="Cat B"
-    )
+    """
+    Testa se a listagem de produtos com o filtro de categoria funciona.
 
+    As duas categorias e os dois produtos são inseridos pelo ORM em um único
+    `commit`; as rotas de criação já são cobertas pelo ciclo de CRUD acima.
+    """
     base_logistics = {"weight_kg": 0.1, "height_cm": 1, "width_cm": 10, "length_cm": 15}
+    cat_a = models.Category(title="Cat A", description="Categoria Cat A")
+    cat_b = models.Category(title="Cat B", description="Categoria Cat B")
+    db_session.add_all(
+        [
+            models.Product(
+                name="Produto A",
+                sku="PROD-A",
+                price=10,
+                category=cat_a,
+                **base_logistics,
+            ),
+            models.Product(
+                name="Produto B",
+                sku="PROD-B",
+                price=20,
+                category=cat_b,
+                **base_logistics,
+            ),
+        ]
+    )
+    db_session.commit()
+    cat_a_id = cat_a.id
 
-    client.post(
-        "/products/",
-        headers=superuser_token_headers,
-        json={
-            "name": "Produto A",
-            "sku": "PROD-A",
-            "price": 10,
-            "category_id": cat_a_id,
-            **base_logistics,
-        },
-    ).raise_for_status()
-
-    client.post(
-        "/products/",
-        headers=superuser_token_headers,
-        json={
-            "name": "Produto B",
-            "sku": "PROD-B",
-            "price": 20,
-            "category_id": cat_b_id,
-            **base_logistics,
-        },
-    ).raise_for_status()
-
-    response = client.get(f"/products/?category_id={cat_a_id}")
+    response = await async_client.get(f"/products/?category_id={cat_a_id}")
     assert response.status_code == 200
 
     products = response.json()
@@ -261,11 +273,13 @@ def test_read_products_filtered_by_category(
 # -------------------------------------------------------------------------- #
 
 
-def test_create_product_with_duplicate_sku(
-    client: TestClient, superuser_token_headers: Dict
+async def test_create_product_with_duplicate_sku(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    category_factory: Callable[[str], int],
 ):
     """Testa a falha ao criar um produto com um SKU que já existe."""
-    category_id = create_category_and_get_id(client, superuser_token_headers, "Livros")
+    category_id = category_factory("Livros")
     product_data = {
         "name": "Livro de Teste",
         "sku": "LIVRO-SKU-UNICO",
@@ -276,25 +290,26 @@ def test_create_product_with_duplicate_sku(
         "width_cm": 15,
         "length_cm": 22,
     }
-    client.post(
+    prod_resp = await async_client.post(
         "/products/", headers=superuser_token_headers, json=product_data
-    ).raise_for_status()
+    )
+    prod_resp.raise_for_status()
 
     product_data_2 = {**product_data, "name": "Outro Livro"}
-    response = client.post(
+    response = await async_client.post(
         "/products/", headers=superuser_token_headers, json=product_data_2
     )
     assert response.status_code == 400
     assert "SKU já cadastrado" in response.json()["detail"]
 
 
-def test_update_product_with_duplicate_sku(
-    client: TestClient, superuser_token_headers: Dict
+async def test_update_product_with_duplicate_sku(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    category_factory: Callable[[str], int],
 ):
     """Testa a falha ao atualizar um produto para um SKU que já pertence a outro."""
-    category_id = create_category_and_get_id(
-        client, superuser_token_headers, "Ferramentas"
-    )
+    category_id = category_factory("Ferramentas")
     base_logistics = {
         "weight_kg": 1.0,
         "height_cm": 10,
@@ -308,9 +323,10 @@ def test_update_product_with_duplicate_sku(
         "category_id": category_id,
         **base_logistics,
     }
-    client.post(
+    prod_resp = await async_client.post(
         "/products/", headers=superuser_token_headers, json=prod1_data
-    ).raise_for_status()
+    )
+    prod_resp.raise_for_status()
     prod2_data = {
         "name": "Chave de Fenda",
         "sku": "FER-002",
@@ -319,21 +335,21 @@ def test_update_product_with_duplicate_sku(
         **base_logistics,
         "weight_kg": 0.3,
     }
-    response = client.post(
+    response = await async_client.post(
         "/products/", headers=superuser_token_headers, json=prod2_data
     )
     product_2_id = response.json()["id"]
 
     update_data = {"sku": "FER-001"}
-    update_response = client.put(
+    update_response = await async_client.put(
         f"/products/{product_2_id}", headers=superuser_token_headers, json=update_data
     )
     assert update_response.status_code == 400
     assert "SKU já pertence a outro produto" in update_response.json()["detail"]
 
 
-def test_create_product_with_nonexistent_category(
-    client: TestClient, superuser_token_headers: Dict
+async def test_create_product_with_nonexistent_category(
+    async_client: AsyncClient, superuser_token_headers: Dict
 ):
     """Testa a criação de um produto com category_id inválida (espera 404)."""
     product_data = {
@@ -347,22 +363,22 @@ def test_create_product_with_nonexistent_category(
         "width_cm": 1,
         "length_cm": 1,
     }
-    response = client.post(
+    response = await async_client.post(
         "/products/", headers=superuser_token_headers, json=product_data
     )
     assert response.status_code == 404, response.text
     assert "Categoria não encontrada" in response.json()["detail"]
 
 
-def test_update_product_with_nonexistent_category(
-    client: TestClient, superuser_token_headers: Dict
+async def test_update_product_with_nonexistent_category(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    category_factory: Callable[[str], int],
 ):
     """
     Testa a atualização de um produto para uma category_id inválida (espera 404).
     """
-    category_id = create_category_and_get_id(
-        client, superuser_token_headers, "Cat Original"
-    )
+    category_id = category_factory("Cat Original")
     prod_data = {
         "name": "Produto a ser movido",
         "sku": "MOVER-01",
@@ -373,31 +389,42 @@ def test_update_product_with_nonexistent_category(
         "width_cm": 5,
         "length_cm": 5,
     }
-    prod_resp = client.post(
+    prod_resp = await async_client.post(
         "/products/", headers=superuser_token_headers, json=prod_data
     )
     product_id = prod_resp.json()["id"]
 
     update_data = {"category_id": 9999}
-    response = client.put(
+    response = await async_client.put(
         f"/products/{product_id}", headers=superuser_token_headers, json=update_data
     )
     assert response.status_code == 404, response.text
     assert "Categoria não encontrada" in response.json()["detail"]
 
 
-def test_update_nonexistent_product(client: TestClient, superuser_token_headers: Dict):
-    """Testa a falha ao tentar atualizar um produto com ID inexistente."""
-    update_data = {"name": "Produto Fantasma", "price": 99.99}
-    response = client.put(
-        "/products/9999", headers=superuser_token_headers, json=update_data
+@pytest.mark.parametrize(
+    "method, json_body, as_superuser",
+    [
+        ("GET", None, False),
+        ("PUT", {"name": "Produto Fantasma", "price": 99.99}, True),
+        ("DELETE", None, True),
+    ],
+    ids=["read", "update", "delete"],
+)
+async def test_nonexistent_product_returns_404(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict,
+    method: str,
+    json_body: Optional[Dict],
+    as_superuser: bool,
+):
+    """
+    Testa que ler (rota pública), atualizar e deletar um produto com ID
+    inexistente retornam 404.
+    """
+    headers = superuser_token_headers if as_superuser else None
+    response = await async_client.request(
+        method, "/products/9999", headers=headers, json=json_body
     )
     assert response.status_code == 404
     assert "Produto não encontrado" in response.json()["detail"]
-
-
-def test_delete_nonexistent_product(client: TestClient, superuser_token_headers: Dict):
-    """Testa a falha ao tentar deletar um produto com ID inexistente."""
-    response = client.delete("/products/9999", headers=superuser_token_headers)
-    assert response.status_code == 404
-    assert "Produto não encontrado" in response.json()["detail"]
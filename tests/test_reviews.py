@@ -76,13 +76,15 @@ def test_create_and_read_review_cycle(
 
     list_resp = client.get(f"/products/{product_id}/reviews")
     assert list_resp.status_code == 200
-    assert len(list_resp.json()) == 1
-    assert list_resp.json()[0]["id"] == review_json["id"]
+    reviews_json = list_resp.json()
+    assert len(reviews_json) == 1
+    assert reviews_json[0]["id"] == review_json["id"]
 
     product_resp = client.get(f"/products/{product_id}")
     assert product_resp.status_code == 200
-    assert len(product_resp.json()["reviews"]) == 1
-    assert product_resp.json()["reviews"][0]["comment"] == "Produto excelente!"
+    product_reviews = product_resp.json()["reviews"]
+    assert len(product_reviews) == 1
+    assert product_reviews[0]["comment"] == "Produto excelente!"
 
 
 def test_get_reviews_for_nonexistent_product(client: TestClient):
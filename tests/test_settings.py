@@ -7,7 +7,8 @@ Suíte de Testes para o módulo de Configurações (Settings).
 # -------------------------------------------------------------------------- #
 import pytest
 from pydantic import ValidationError
-from src.settings import load_settings
+from src import settings as settings_module
+from src.settings import get_settings, load_settings
 
 # -------------------------------------------------------------------------- #
 #                           TESTES DE CONFIGURAÇÃO                           #
@@ -41,3 +42,30 @@ def test_load_settings_fails_on_validation_error(mocker):
         load_settings()
 
     assert "Verifique se o arquivo .env existe" in str(excinfo.value)
+
+
+def test_get_settings_returns_cached_instance():
+    """
+    Testa se `get_settings` valida as configurações uma única vez e se o
+    atributo `settings` do módulo aponta para a mesma instância em cache.
+    """
+    assert get_settings() is get_settings()
+    assert settings_module.settings is get_settings()
+
+
+def test_get_settings_cache_clear_reloads():
+    """Testa se `cache_clear` força um novo carregamento das configurações."""
+    first = get_settings()
+    get_settings.cache_clear()
+
+    reloaded = get_settings()
+    assert reloaded is not first
+    assert reloaded == first
+
+
+def test_database_url_is_built_once_per_instance():
+    """Testa se `DATABASE_URL` é montado uma única vez e reutilizado."""
+    current = get_settings()
+    assert current.DATABASE_URL is current.DATABASE_URL
+    assert str(current.DATABASE_URL).startswith("postgresql://")
+    assert "DATABASE_URL" in current.model_dump()
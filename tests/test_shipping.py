@@ -207,8 +207,9 @@ def test_calculate_shipping_for_multiple_items(
         json={"postal_code": "11111-222"},
     )
     assert response.status_code == 200
-    assert len(response.json()) == 1
-    assert response.json()[0]["name"] == "Entrega Combinada"
+    shipping_options = response.json()
+    assert len(shipping_options) == 1
+    assert shipping_options[0]["name"] == "Entrega Combinada"
 
 
 # -------------------------------------------------------------------------- #
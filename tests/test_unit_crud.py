@@ -11,6 +11,8 @@ que são difíceis de acionar através dos endpoints da API, como retornos
 import pytest
 from unittest.mock import patch
 
+from pydantic import ValidationError
+
 from src import crud, schemas
 from src.schemas import ProductUpdate
 
@@ -53,3 +55,18 @@ def test_crud_delete_category_not_found(db_session):
     """Testa delete_category retornando None para um id inexistente."""
     result = crud.delete_category(db_session, 999)
     assert result is None
+
+
+def test_order_item_schema_keeps_deleted_product_as_none():
+    """Testa se um item de pedido sem produto (excluído) retorna `product` nulo."""
+    item = schemas.OrderItem.model_validate(
+        {"quantity": 1, "price_at_purchase": 10.0, "product": None}
+    )
+    assert item.product is None
+    assert item.model_dump()["product"] is None
+
+
+def test_cart_schema_items_require_a_list():
+    """Testa se `Cart.items` aceita apenas listas (modo estrito, sem coerção)."""
+    with pytest.raises(ValidationError):
+        schemas.Cart.model_validate({"id": 1, "items": ()})